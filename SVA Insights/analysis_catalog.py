@@ -0,0 +1,605 @@
+#!/usr/bin/env python3
+"""
+Analysis Catalog for SemperVirens Accelerator
+Keeps the analysis corpus in memory and reloads only files that changed on disk
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from sva_logging import get_logger
+
+log = get_logger('catalog')
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pinned in requirements.txt; the stdlib decoder covers checkouts without it
+    _json_loads = json.loads
+
+
+COMPREHENSIVE_SUFFIX = '_comprehensive_analysis.json'
+
+# The six top-level sections of a comprehensive analysis, in display order
+SIX_TS = ['team', 'tam', 'technology', 'traction', 'timing', 'terms']
+
+# Spreadsheet exports use "5/9/2025 7:49:03"; older files use ISO-style dates
+_SUBMITTED_AT_FORMATS = ['%m/%d/%Y %H:%M:%S', '%m/%d/%Y %H:%M', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d']
+
+# Submissions before the first cutoff are cohort 1, before the second cohort 2, ...
+# Overridable with SVA_COHORT_CUTOFFS, e.g. "2025-05-16,2025-09-01"
+DEFAULT_COHORT_CUTOFFS = '2025-05-16'
+
+# Cohorts that don't follow from submitted_at, by company slug. They keep the
+# assignments of the old hard-coded date table: Toothsome applied on May 2
+# (its analysis records a later resubmission), and GTMFlow, listed there as
+# "GTM Flow", was shown in cohort 2.
+COHORT_OVERRIDES = {'toothsome': 1, 'gtmflow': 2}
+
+# Words that are dropped from the front of a name when building short aliases
+_ALIAS_STOPWORDS = {'the'}
+_MIN_ALIAS_LENGTH = 4
+
+# Links in circulation that no derived alias covers: abbreviations, typos,
+# and short names two companies share ("mandala" also prefixes Mandala.AI)
+EXPLICIT_ALIASES = {
+    'blankslatetech': 'blank_slate_technologies_comprehensive_analysis.json',
+    'clsp': 'clasp_comprehensive_analysis.json',
+    'mandala': 'mandala_for_us_inc_comprehensive_analysis.json',
+}
+
+
+def company_slug(name: str) -> str:
+    """URL slug for a company name: lowercase letters and digits only"""
+    return re.sub(r'[^a-z0-9]', '', (name or '').lower())
+
+
+def parse_submitted_at(value) -> Optional[datetime]:
+    """Parse a submitted_at value in any of the formats found in the corpus"""
+    value = (value or '').strip() if isinstance(value, str) else ''
+    for fmt in _SUBMITTED_AT_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def submitted_timestamp(value) -> Optional[float]:
+    """submitted_at as epoch seconds (the corpus records naive UTC times), or None"""
+    submitted = parse_submitted_at(value)
+    return submitted.replace(tzinfo=timezone.utc).timestamp() if submitted else None
+
+
+def parse_cohort_cutoffs(value: Optional[str] = None) -> List[float]:
+    """Parse comma-separated YYYY-MM-DD cohort start dates into sorted epoch seconds"""
+    cutoffs = set()
+    for item in (value or DEFAULT_COHORT_CUTOFFS).split(','):
+        timestamp = submitted_timestamp(item)
+        if timestamp is None:
+            if item.strip():
+                log.warning("Ignoring invalid cohort cutoff %r", item)
+            continue
+        cutoffs.add(timestamp)
+    return sorted(cutoffs)
+
+
+def cohort_for(submitted_ts: Optional[float], cutoffs: List[float]) -> int:
+    """Cohort number for a submission time; undated submissions go to the latest cohort"""
+    if submitted_ts is None:
+        return len(cutoffs) + 1
+    return bisect.bisect_right(cutoffs, submitted_ts) + 1
+
+
+def _format_day(timestamp: float) -> str:
+    day = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    return f"{day:%B} {day.day}, {day.year}"
+
+
+def cohort_description(cohort: int, cutoffs: List[float]) -> str:
+    """Date range of a cohort, e.g. "Through May 15, 2025" or "May 16, 2025 onwards" """
+    if not cutoffs:
+        return "All submissions"
+    if cohort > len(cutoffs):
+        return f"{_format_day(cutoffs[-1])} onwards"
+    last_day = _format_day(cutoffs[cohort - 1] - 86400)
+    if cohort == 1:
+        return f"Through {last_day}"
+    return f"{_format_day(cutoffs[cohort - 2])} to {last_day}"
+
+
+def section_score(analysis: dict, section: str) -> Optional[float]:
+    """Numeric score of one of the 6Ts, tolerating scores stored as strings; works on typed models too"""
+    value = analysis.get(section)
+    if hasattr(value, 'get'):
+        value = value.get('score')
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def company_aliases(name: str) -> List[str]:
+    """
+    Shorter slugs a company is commonly linked by
+
+    "Sunny Health AI" -> ["sunny", "sunnyhealth"]; "The PEO App, Inc." also
+    yields the same prefixes without the leading "the" ("peoapp", ...).
+    """
+    words = re.findall(r'[a-z0-9]+', (name or '').lower())
+    candidates = [words]
+    if words and words[0] in _ALIAS_STOPWORDS:
+        candidates.append(words[1:])
+
+    aliases = []
+    for word_list in candidates:
+        for end in range(1, len(word_list) + 1):
+            alias = ''.join(word_list[:end])
+            if len(alias) >= _MIN_ALIAS_LENGTH and alias not in aliases:
+                aliases.append(alias)
+    return aliases
+
+
+def _plain(obj):
+    """json.dumps fallback for transformed documents that expose to_dict()"""
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class CatalogEntry:
+    """
+    A single analysis file held by the catalog.
+
+    Entries backed by a corpus snapshot carry a loader instead of data and
+    decode on first access; their offset-table record supplies the company
+    name and token without decoding. `digest` is the SHA-1 of the file bytes.
+    """
+
+    __slots__ = ('path', 'mtime_ns', 'size', 'digest', '_data', '_loader', '_meta', '_shards')
+
+    def __init__(self, path: Path, mtime_ns: int, size: int, data=None, digest: Optional[str] = None,
+                 loader: Optional[Callable] = None, meta: Optional[dict] = None):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        self._data = data
+        self._loader = loader
+        self._meta = meta
+        self._shards: Dict[str, str] = {}
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def data(self):
+        loader = self._loader
+        if loader is not None:
+            self._data = loader()
+            self._loader = None
+        return self._data
+
+    @property
+    def last_modified(self) -> datetime:
+        return datetime.fromtimestamp(self.mtime_ns / 1e9, tz=timezone.utc)
+
+    @property
+    def available(self) -> bool:
+        """True if the entry has (or can lazily produce) a parsed document"""
+        return self._loader is not None or self._data is not None
+
+    def field(self, key: str) -> str:
+        """A top-level string field, read from the snapshot record when there is one"""
+        if self._meta is not None and key in self._meta:
+            return self._meta[key] or ''
+        return (self.data.get(key) if self.data is not None else '') or ''
+
+    def shard(self, section: str) -> str:
+        """Serialized JSON for one top-level section, encoded once per load"""
+        shard = self._shards.get(section)
+        if shard is None:
+            shard = json.dumps(self.data.get(section) or {}, ensure_ascii=False, default=_plain)
+            self._shards[section] = shard
+        return shard
+
+
+class AnalysisCatalog:
+    """
+    Process-wide view of the analysis directory.
+
+    Each refresh stats the directory once and only re-reads files whose
+    mtime or size changed since the last load; deleted files are dropped.
+    An optional transform is applied to each document once, as it is loaded.
+    Files held current by an optional snapshot (see analysis_snapshot) are not
+    opened at all and are decoded from it lazily.
+    """
+
+    def __init__(self, analysis_dir: Path, pattern: str = '_analysis.json', transform: Optional[Callable] = None,
+                 snapshot=None):
+        self.analysis_dir = Path(analysis_dir)
+        self.pattern = pattern
+        self.transform = transform
+        self.snapshot = snapshot
+        self._entries: Dict[str, CatalogEntry] = {}
+        self._aliases: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.version = 0
+
+    def refresh(self) -> bool:
+        """
+        Bring the catalog in line with the directory contents
+
+        Returns:
+            True if any file was added, changed or removed
+        """
+        with self._lock:
+            seen = set()
+            changed = False
+
+            if self.snapshot is not None:
+                self.snapshot.refresh()
+
+            try:
+                scan = list(os.scandir(self.analysis_dir))
+            except FileNotFoundError:
+                scan = []
+
+            for dir_entry in scan:
+                if not dir_entry.name.endswith(self.pattern) or not dir_entry.is_file():
+                    continue
+                seen.add(dir_entry.name)
+
+                try:
+                    stat = dir_entry.stat()
+                except OSError:
+                    continue
+
+                cached = self._entries.get(dir_entry.name)
+                if cached and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+                    continue
+
+                path = Path(dir_entry.path)
+                record = self.snapshot.record(dir_entry.name, stat.st_mtime_ns, stat.st_size) if self.snapshot else None
+                if record is not None:
+                    self._entries[dir_entry.name] = CatalogEntry(
+                        path, stat.st_mtime_ns, stat.st_size, digest=record['sha1'],
+                        loader=lambda name=dir_entry.name, path=path: self._load_packed(name, path), meta=record
+                    )
+                    changed = True
+                    continue
+
+                data, digest = self._load(path)
+                if data is None and cached:
+                    # Keep serving the previous copy while a write is in progress;
+                    # the finished write bumps the mtime again and is picked up then
+                    data, digest = cached.data, cached.digest
+
+                self._entries[dir_entry.name] = CatalogEntry(path, stat.st_mtime_ns, stat.st_size, data, digest)
+                changed = True
+
+            for name in list(self._entries):
+                if name not in seen:
+                    del self._entries[name]
+                    changed = True
+
+            if changed:
+                self.version += 1
+                self._build_aliases()
+            return changed
+
+    def _build_aliases(self):
+        """
+        Map every slug, filename stem, token and short alias to a filename.
+
+        Exact identifiers (slug, stem, token) always beat EXPLICIT_ALIASES,
+        which beat derived short aliases; comprehensive analyses beat legacy
+        ones, and a short alias shared by two different companies is left
+        out rather than guessed.
+        """
+        exact: Dict[str, str] = {}
+        short: Dict[str, Optional[str]] = {}
+
+        def rank(name):
+            return (not name.endswith(COMPREHENSIVE_SUFFIX), name)
+
+        for name in sorted(self._entries, key=rank):
+            entry = self._entries[name]
+            if not entry.available:
+                continue
+            company_name = entry.field('company_name')
+            stem = name[:-len(self.pattern)].replace('_comprehensive', '')
+
+            keys = [company_slug(company_name), company_slug(stem), entry.field('token').strip().lower()]
+            for key in keys:
+                if key and key not in exact:
+                    exact[key] = name
+
+            for alias in company_aliases(company_name):
+                if alias not in short:
+                    short[alias] = name
+                elif short[alias] and company_slug(self._entries[short[alias]].field('company_name')) != company_slug(company_name):
+                    short[alias] = None
+
+        aliases = {alias: name for alias, name in short.items() if name}
+        aliases.update((alias, name) for alias, name in EXPLICIT_ALIASES.items()
+                       if name in self._entries and self._entries[name].available)
+        aliases.update(exact)
+        self._aliases = aliases
+
+    def _load(self, path: Path):
+        """Returns (document, SHA-1 of the file), or (None, None) if it can't be parsed"""
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+            return self._decode(raw), hashlib.sha1(raw).hexdigest()
+        except Exception as e:
+            log.warning("Error processing file %s: %s", path, e)
+            return None, None
+
+    def _load_packed(self, name: str, path: Path):
+        """Decode an entry from the snapshot, falling back to its file"""
+        try:
+            raw = self.snapshot.read(name)
+            if raw is not None:
+                return self._decode(raw)
+        except Exception as e:
+            log.warning("Error decoding %s from snapshot: %s", name, e)
+        return self._load(path)[0]
+
+    def _decode(self, raw: bytes):
+        data = _json_loads(raw)
+        if not isinstance(data, dict):
+            return None
+        return self.transform(data) if self.transform else data
+
+    def entries(self, suffix: Optional[str] = None) -> List[CatalogEntry]:
+        """Return catalog entries sorted by filename, optionally filtered by filename suffix"""
+        self.refresh()
+        with self._lock:
+            entries = sorted(self._entries.values(), key=lambda e: e.name)
+        if suffix:
+            entries = [e for e in entries if e.name.endswith(suffix)]
+        return [e for e in entries if e.available]
+
+    def analyses(self, suffix: Optional[str] = None) -> list:
+        """Return the parsed analysis documents"""
+        documents = (e.data for e in self.entries(suffix))
+        return [d for d in documents if d is not None]
+
+    def filenames(self, suffix: Optional[str] = None) -> List[str]:
+        """Return the analysis filenames currently on disk"""
+        return [e.name for e in self.entries(suffix)]
+
+    def resolve(self, slug: str) -> Optional[CatalogEntry]:
+        """Find the analysis for a URL slug, filename stem, short alias or token"""
+        self.refresh()
+        with self._lock:
+            name = self._aliases.get(company_slug(slug))
+            entry = self._entries.get(name) if name else None
+        return entry if entry is not None and entry.available else None
+
+    def get(self, filename: str) -> Optional[CatalogEntry]:
+        """Look up a single entry by filename"""
+        self.refresh()
+        with self._lock:
+            return self._entries.get(filename)
+
+
+def competitor_names(analysis: dict) -> List[str]:
+    """Names of the primary competitors an analysis lists, deduplicated in order"""
+    lists = []
+    team = analysis.get('team')
+    comparison = team.get('category_comparison') if isinstance(team, dict) else None
+    if isinstance(comparison, dict):
+        lists.append(comparison.get('primary_competitors'))
+    expanded = analysis.get('category_comparison_expanded')
+    if isinstance(expanded, dict):
+        lists.append(expanded.get('primary_competitors'))
+
+    names = []
+    for competitors in lists:
+        for competitor in competitors if isinstance(competitors, list) else []:
+            name = competitor.get('name') if isinstance(competitor, dict) else competitor
+            if isinstance(name, str) and name.strip() and name.strip() not in names:
+                names.append(name.strip())
+    return names
+
+
+def card_summary(analysis: dict) -> dict:
+    """Extract the handful of fields the index cards display from a full analysis"""
+    founder = ''
+    team = analysis.get('team')
+    if isinstance(team, dict) and team.get('founder_deep_dive'):
+        founder = team['founder_deep_dive'][0].get('name', '')
+    elif isinstance(analysis.get('founder_profile'), dict):
+        founder = analysis['founder_profile'].get('name', '')
+
+    recommendation = analysis.get('final_recommendation')
+    if isinstance(recommendation, dict):
+        status = recommendation.get('status', '')
+    else:
+        status = recommendation or ''
+
+    company_name = analysis.get('company_name', '')
+    return {
+        'company_name': company_name,
+        'slug': company_slug(company_name),
+        'description': analysis.get('description', ''),
+        'problem_statement': analysis.get('problem_statement', ''),
+        'competitors': competitor_names(analysis),
+        'website': analysis.get('website', ''),
+        'year_founded': analysis.get('year_founded', ''),
+        'submitted_at': analysis.get('submitted_at', ''),
+        'submitted_ts': submitted_timestamp(analysis.get('submitted_at')),
+        'founder': founder,
+        'status': status,
+        'scores': {t: section_score(analysis, t) for t in SIX_TS},
+    }
+
+
+# Bump whenever card_summary() changes shape so stale index files are rebuilt
+CARD_INDEX_VERSION = 5
+
+
+class CardIndex:
+    """
+    Persistent index of card summaries, one small record per analysis file.
+
+    The index page renders from this alone. Records are keyed by filename and
+    carry the mtime/size of the analysis they were built from, so only new or
+    changed analyses are parsed when the index is refreshed. A corpus snapshot,
+    if given, supplies prebuilt summaries before any file is opened.
+
+    cards() returns the summaries oldest submission first, each tagged with
+    its analysis `file` and its `cohort` under the given cutoffs (epoch seconds, see
+    parse_cohort_cutoffs) unless COHORT_OVERRIDES names its slug. Cohorts
+    are assigned on load rather than stored, so changing the cutoffs needs
+    no rebuild.
+
+    After cards(), `etag` is a hash of the card data and `last_modified` the
+    newest analysis mtime, for conditional responses on the index page.
+    """
+
+    def __init__(self, analysis_dir: Path, index_path: Path, suffix: str = COMPREHENSIVE_SUFFIX, snapshot=None,
+                 cohort_cutoffs: Optional[List[float]] = None):
+        self.analysis_dir = Path(analysis_dir)
+        self.index_path = Path(index_path)
+        self.suffix = suffix
+        self.snapshot = snapshot
+        self.cohort_cutoffs = cohort_cutoffs if cohort_cutoffs is not None else parse_cohort_cutoffs()
+        self._records: Optional[Dict[str, dict]] = None
+        self._cards: Optional[List[dict]] = None
+        self._lock = threading.Lock()
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[datetime] = None
+
+    def _read_index(self) -> Dict[str, dict]:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not isinstance(data, dict) or data.get('version') != CARD_INDEX_VERSION:
+                return {}
+            return data.get('cards', {})
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self):
+        """Atomically persist the index; read-only deployments keep it in memory only"""
+        tmp_path = self.index_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CARD_INDEX_VERSION, 'cards': self._records}, f, separators=(',', ':'), ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            log.warning("Could not write card index %s: %s", self.index_path, e)
+
+    def cards(self) -> List[dict]:
+        """Return card summaries for every analysis, refreshing stale records first"""
+        with self._lock:
+            if self._records is None:
+                self._records = self._read_index()
+
+            seen = set()
+            dirty = False
+
+            if self.snapshot is not None:
+                self.snapshot.refresh()
+
+            try:
+                scan = list(os.scandir(self.analysis_dir))
+            except FileNotFoundError:
+                scan = []
+
+            for dir_entry in scan:
+                if not dir_entry.name.endswith(self.suffix) or not dir_entry.is_file():
+                    continue
+                seen.add(dir_entry.name)
+
+                try:
+                    stat = dir_entry.stat()
+                except OSError:
+                    continue
+
+                record = self._records.get(dir_entry.name)
+                if record and record['mtime_ns'] == stat.st_mtime_ns and record['size'] == stat.st_size:
+                    continue
+
+                card = self.snapshot.card(dir_entry.name, stat.st_mtime_ns, stat.st_size) if self.snapshot else None
+                if card is not None:
+                    self._records[dir_entry.name] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'card': card}
+                    dirty = True
+                    continue
+
+                try:
+                    with open(dir_entry.path, 'r', encoding='utf-8') as f:
+                        analysis = json.load(f)
+                except Exception as e:
+                    log.warning("Error processing file %s: %s", dir_entry.path, e)
+                    continue
+                if not isinstance(analysis, dict):
+                    continue
+
+                self._records[dir_entry.name] = {
+                    'mtime_ns': stat.st_mtime_ns,
+                    'size': stat.st_size,
+                    'card': card_summary(analysis),
+                }
+                dirty = True
+
+            for name in list(self._records):
+                if name not in seen:
+                    del self._records[name]
+                    dirty = True
+
+            if dirty:
+                self._write_index()
+
+            if dirty or self._cards is None or self.etag is None:
+                self._cards = self._bucket_cards()
+                self.etag = hashlib.sha1(json.dumps(self._cards, sort_keys=True).encode('utf-8')).hexdigest()
+                newest = max((r['mtime_ns'] for r in self._records.values()), default=0)
+                self.last_modified = datetime.fromtimestamp(newest / 1e9, tz=timezone.utc)
+            return self._cards
+
+    def _bucket_cards(self) -> List[dict]:
+        """Cards in submission order (undated last, then by filename), tagged with their cohort"""
+        def order(name):
+            submitted_ts = self._records[name]['card'].get('submitted_ts')
+            return (submitted_ts is None, submitted_ts or 0, name)
+
+        cards = []
+        for name in sorted(self._records, key=order):
+            card = self._records[name]['card']
+            cohort = COHORT_OVERRIDES.get(card.get('slug')) or cohort_for(card.get('submitted_ts'), self.cohort_cutoffs)
+            cards.append({**card, 'file': name, 'cohort': cohort})
+        return cards
+
+    def cohorts(self) -> List[int]:
+        """Cohort numbers, oldest first: one per cutoff interval that has submissions"""
+        return sorted({card['cohort'] for card in self.cards()})
+
+    def update(self, path: Path, analysis: dict):
+        """Record the summary of an analysis that was just written to disk"""
+        path = Path(path)
+        if not path.name.endswith(self.suffix):
+            return
+        stat = path.stat()
+        with self._lock:
+            if self._records is None:
+                self._records = self._read_index()
+            self._records[path.name] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'card': card_summary(analysis),
+            }
+            self.etag = None
+            self._write_index()
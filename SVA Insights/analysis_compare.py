@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Company Comparison for SemperVirens Accelerator
+Lines several analyses up side by side for the /compare view: 6T scores with
+the leader of each row, short aligned excerpts (market size, traction, raise)
+and each company's top red flags.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+from analysis_catalog import SIX_TS, section_score
+
+# More columns than this stop fitting on a screen
+MAX_COMPANIES = 10
+
+# (label, section, sub-section, field) of each excerpt row, in display order
+EXCERPT_FIELDS = [
+    ('TAM', 'tam', 'market_analysis', 'total_addressable_market'),
+    ('SAM', 'tam', 'market_analysis', 'serviceable_addressable_market'),
+    ('Market growth', 'tam', 'market_analysis', 'market_growth_rate'),
+    ('Revenue', 'traction', 'growth_metrics', 'revenue_growth'),
+    ('Customers', 'traction', 'growth_metrics', 'customer_metrics'),
+    ('Round', 'terms', 'investment_details', 'round_stage'),
+    ('Raise', 'terms', 'investment_details', 'raise_amount'),
+    ('Post-money', 'terms', 'investment_details', 'post_money_valuation'),
+]
+
+EXCERPT_LENGTH = 160
+TOP_RED_FLAGS = 3
+
+SECTION_LABELS = {t: 'TAM' if t == 'tam' else t.title() for t in SIX_TS}
+
+# "$13B", "$1.5 million", "$500-5400", "$50B+"
+_MONEY = re.compile(r'\$\s?\d[\d,.]*(?:\s?-\s?\$?\d[\d,.]*)?\+?\s?(?:[KMBT]\b|thousand|million|billion|trillion)?\+?',
+                    re.IGNORECASE)
+
+
+def lookup(analysis, *path):
+    """Follow keys through nested dicts or typed records; None if any step is missing"""
+    value = analysis
+    for key in path:
+        if not hasattr(value, 'get'):
+            return None
+        value = value.get(key)
+    return value
+
+
+def excerpt(text, length: int = EXCERPT_LENGTH) -> str:
+    """First sentence of a text, cut at a word boundary if still too long"""
+    if not isinstance(text, str):
+        return ''
+    text = ' '.join(text.split())
+    sentence = re.split(r'(?<=[.!?])\s', text, maxsplit=1)[0]
+    if len(sentence) <= length:
+        return sentence
+    return sentence[:length].rsplit(' ', 1)[0] + '...'
+
+
+def money_figure(text) -> Optional[str]:
+    """The first dollar amount in a text, e.g. "$13B", or None"""
+    match = _MONEY.search(text) if isinstance(text, str) else None
+    return match.group(0).strip() if match else None
+
+
+def top_red_flags(analysis, limit: int = TOP_RED_FLAGS) -> List[Tuple[str, str]]:
+    """
+    (section label, flag) pairs, taking the first flag of the weakest
+    sections first so a low score's main concern is never crowded out
+    """
+    def weakness(t):
+        score = section_score(analysis, t)
+        return score if score is not None else 6
+
+    queues = [(t, list(lookup(analysis, t, 'red_flags') or [])) for t in sorted(SIX_TS, key=weakness)]
+    flags = []
+    while len(flags) < limit and any(queue for _, queue in queues):
+        for t, queue in queues:
+            if queue and len(flags) < limit:
+                flags.append((SECTION_LABELS[t], excerpt(queue.pop(0))))
+    return flags
+
+
+def build_comparison(analyses: List[Tuple[str, object]]) -> dict:
+    """
+    Build the comparison table for (slug, analysis) pairs
+
+    Returns:
+        Dict with `companies` (one column each), `score_rows` (per T, with
+        the best score marked unless all tie), `excerpt_rows` and
+        `red_flags` per company
+    """
+    companies = []
+    for slug, analysis in analyses:
+        scores = [section_score(analysis, t) for t in SIX_TS]
+        known = [score for score in scores if score is not None]
+        companies.append({
+            'slug': slug,
+            'company_name': analysis.get('company_name') or slug,
+            'status': lookup(analysis, 'final_recommendation', 'status') or '',
+            'total': sum(known) if known else None,
+            'scores': scores,
+        })
+
+    score_rows = []
+    for i, t in enumerate(SIX_TS):
+        scores = [company['scores'][i] for company in companies]
+        known = [score for score in scores if score is not None]
+        score_rows.append({'label': SECTION_LABELS[t], 'scores': scores,
+                           'best': max(known) if len(set(known)) > 1 else None})
+
+    excerpt_rows = []
+    for label, *path in EXCERPT_FIELDS:
+        cells = []
+        for _, analysis in analyses:
+            text = lookup(analysis, *path)
+            cells.append({'figure': money_figure(text), 'text': excerpt(text)})
+        excerpt_rows.append({'label': label, 'cells': cells})
+
+    totals = [company['total'] for company in companies if company['total'] is not None]
+    return {
+        'companies': companies,
+        'score_rows': score_rows,
+        'best_total': max(totals) if len(set(totals)) > 1 else None,
+        'excerpt_rows': excerpt_rows,
+        'red_flags': [top_red_flags(analysis) for _, analysis in analyses],
+    }
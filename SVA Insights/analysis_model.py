@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Typed In-Memory Model for SemperVirens 6Ts Analyses
+Compact __slots__ classes for the six sections, founders and competitors.
+Dict keys and short repeated values (statuses, roles, sub-section keys) are
+interned so every cached analysis shares one copy of each.
+"""
+
+import sys
+from typing import Optional
+
+from analysis_catalog import SIX_TS
+from analysis_schema import normalize_analysis
+
+# Strings at or under this length are interned; longer ones are free text
+_INTERN_MAX_LENGTH = 40
+
+
+def _intern(value):
+    """Recursively intern dict keys and short string values"""
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) <= _INTERN_MAX_LENGTH else value
+    if isinstance(value, dict):
+        return {sys.intern(k): _intern(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_intern(v) for v in value]
+    return value
+
+
+def _to_plain(value):
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {k: _to_plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(v) for v in value]
+    return value
+
+
+class Record:
+    """
+    Base for the typed classes.
+
+    Known fields live in __slots__ (None when absent, with their names in
+    `missing`); anything else from the source document is kept in `extra`,
+    so to_dict() round-trips, explicit nulls included. Item access and get()
+    mirror dict behaviour, which is also what Jinja falls back to for
+    attributes.
+    """
+
+    __slots__ = ('extra', 'missing')
+    FIELDS: tuple = ()
+
+    def __init__(self, data: dict):
+        extra = {}
+        for key, value in data.items():
+            if key in self.FIELDS:
+                setattr(self, key, self._convert(key, value))
+            else:
+                extra[sys.intern(key)] = _intern(value)
+        missing = tuple(key for key in self.FIELDS if key not in data)
+        for key in missing:
+            setattr(self, key, None)
+        self.extra = extra
+        self.missing = missing
+
+    def _convert(self, key, value):
+        return _intern(value)
+
+    def __getitem__(self, key):
+        if key in self.FIELDS:
+            return getattr(self, key)
+        return self.extra[key]
+
+    def __contains__(self, key):
+        return (key in self.FIELDS and getattr(self, key) is not None) or key in self.extra
+
+    def get(self, key, default=None):
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        return default if value is None else value
+
+    def to_dict(self) -> dict:
+        data = {key: _to_plain(getattr(self, key)) for key in self.FIELDS if key not in self.missing}
+        data.update(_to_plain(self.extra))
+        return data
+
+
+class Founder(Record):
+    __slots__ = FIELDS = ('name', 'role', 'linkedin', 'background', 'domain_expertise', 'previous_startups',
+                          'notable_achievements', 'leadership_signals', 'track_record')
+
+
+class Competitor(Record):
+    __slots__ = FIELDS = ('name', 'description', 'strengths', 'weaknesses', 'comparison')
+
+
+class Section(Record):
+    """One of the 6Ts: score, justification, red flags plus section-specific sub-sections"""
+
+    __slots__ = ('score', 'justification', 'red_flags')
+    FIELDS = ('score', 'justification', 'red_flags')
+
+    def _convert(self, key, value):
+        if key == 'red_flags':
+            return tuple(value) if isinstance(value, list) else ()
+        return _intern(value)
+
+
+class Team(Section):
+    __slots__ = ('company_assessment', 'founder_deep_dive', 'category_comparison')
+    FIELDS = Section.FIELDS + __slots__
+
+    def _convert(self, key, value):
+        if key == 'founder_deep_dive' and isinstance(value, list):
+            return [Founder(f) if isinstance(f, dict) else f for f in value]
+        if key == 'category_comparison' and isinstance(value, dict):
+            value = _intern(value)
+            competitors = value.get('primary_competitors')
+            if isinstance(competitors, list):
+                value['primary_competitors'] = [Competitor(c) if isinstance(c, dict) else c for c in competitors]
+            return value
+        return super()._convert(key, value)
+
+
+class Tam(Section):
+    __slots__ = ('market_analysis', 'customer_analysis')
+    FIELDS = Section.FIELDS + __slots__
+
+
+class Technology(Section):
+    __slots__ = ('technical_assessment', 'competitive_advantage')
+    FIELDS = Section.FIELDS + __slots__
+
+
+class Traction(Section):
+    __slots__ = ('growth_metrics', 'market_validation', 'successes_and_areas_of_investigation')
+    FIELDS = Section.FIELDS + __slots__
+
+
+class Timing(Section):
+    __slots__ = ('market_timing', 'competitive_timing')
+    FIELDS = Section.FIELDS + __slots__
+
+
+class Terms(Section):
+    __slots__ = ('investment_details', 'terms_analysis')
+    FIELDS = Section.FIELDS + __slots__
+
+
+class Recommendation(Record):
+    __slots__ = FIELDS = ('status', 'rationale', 'key_factors', 'next_steps')
+
+
+SECTION_TYPES = {
+    'team': Team,
+    'tam': Tam,
+    'technology': Technology,
+    'traction': Traction,
+    'timing': Timing,
+    'terms': Terms,
+}
+
+
+class Analysis(Record):
+    """A canonical analysis document (see analysis_schema.normalize_analysis)"""
+
+    __slots__ = ('company_name', 'token', 'submitted_at', 'website', 'year_founded', 'description',
+                 'problem_statement', 'pitch_deck_link', 'demo_link', 'schema_version',
+                 *SIX_TS, 'final_recommendation')
+    FIELDS = __slots__
+
+    def _convert(self, key, value):
+        if key in SECTION_TYPES and isinstance(value, dict):
+            return SECTION_TYPES[key](value)
+        if key == 'final_recommendation' and isinstance(value, dict):
+            return Recommendation(value)
+        return _intern(value)
+
+
+def to_model(analysis: Optional[dict]) -> Optional[Analysis]:
+    """Normalize an analysis document and build its typed representation"""
+    if not isinstance(analysis, dict):
+        return None
+    return Analysis(normalize_analysis(analysis))
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Canonical Analysis Schema for SemperVirens Accelerator
+Normalizes legacy, 6Ts and freshly generated analyses into one versioned shape
+so the web app can render them without per-request fix-ups.
+
+Usage:
+    python analysis_schema.py migrate   # rewrite analysis/*.json in canonical form
+"""
+
+import argparse
+import copy
+import json
+from pathlib import Path
+
+from analysis_catalog import SIX_TS
+
+# Bump when the canonical shape changes; documents carrying the current
+# version are returned untouched
+SCHEMA_VERSION = 1
+
+TOP_LEVEL_FIELDS = ['company_name', 'token', 'submitted_at', 'website', 'year_founded',
+                    'description', 'problem_statement', 'pitch_deck_link', 'demo_link']
+
+LEGACY_SCORE_CATEGORIES = ['market_opportunity', 'product_differentiation', 'go_to_market_traction',
+                           'ecosystem_signals', 'founder_team_strength', 'strategic_fit']
+
+THESIS_FIT_CATEGORIES = ['sector_fit', 'employer_ecosystem_leverage', 'gtm_support_potential',
+                         'strategic_partner_amplification', 'acceleration_readiness']
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent
+ANALYSIS_DIR = PROJECT_ROOT / "analysis"
+
+
+def coerce_score(value):
+    """Scores are ints 1-5 or None; the corpus also has floats and numeric strings"""
+    try:
+        score = round(float(value))
+    except (TypeError, ValueError):
+        return None
+    return score if 1 <= score <= 5 else None
+
+
+def _lift_top_level_fields(doc):
+    """First-generation analyses kept company details under executive_summary"""
+    summary = doc.get('executive_summary')
+    if isinstance(summary, dict):
+        for field in TOP_LEVEL_FIELDS:
+            if not doc.get(field) and summary.get(field):
+                doc[field] = summary[field]
+    for field in TOP_LEVEL_FIELDS:
+        if doc.get(field) is None:
+            doc[field] = ''
+
+
+def _normalize_six_ts(doc):
+    # One legacy layout nested the six sections under a "6Ts" key
+    nested = doc.pop('6Ts', None)
+    for t in SIX_TS:
+        section = doc.get(t)
+        if not isinstance(section, dict) and isinstance(nested, dict):
+            section = nested.get(t)
+        section = section if isinstance(section, dict) else {}
+        section['score'] = coerce_score(section.get('score'))
+        section.setdefault('justification', '')
+        if not isinstance(section.get('red_flags'), list):
+            section['red_flags'] = []
+        doc[t] = section
+
+
+def _normalize_legacy_sections(doc):
+    """Fill the pre-6Ts structures the same way the detail view used to on every request"""
+    if not isinstance(doc.get('executive_summary'), dict):
+        doc['executive_summary'] = {
+            'company_name': doc.get('company_name', ''),
+            'website': doc.get('website', ''),
+            'year_founded': doc.get('year_founded', ''),
+            'description': doc.get('description', '')
+        }
+
+    for key, categories in (('scoring', LEGACY_SCORE_CATEGORIES), ('sv_thesis_fit', THESIS_FIT_CATEGORIES)):
+        scores = doc.get(key) if isinstance(doc.get(key), dict) else {}
+        if key == 'sv_thesis_fit' and not scores and isinstance(doc.get('thesis_fit'), dict):
+            scores = doc['thesis_fit']
+        for category in categories:
+            entry = scores.get(category)
+            if not isinstance(entry, dict):
+                entry = {'justification': f'No {category.replace("_", " ")} assessment available.'}
+            entry['score'] = coerce_score(entry.get('score'))
+            scores[category] = entry
+        doc[key] = scores
+
+    if not isinstance(doc.get('founder_profile'), dict):
+        doc['founder_profile'] = {'name': 'Not available', 'highlights': [], 'linkedin': ''}
+
+    doc.setdefault('red_flags', [])
+    doc.setdefault('category_comparison', '')
+    doc.setdefault('successes_and_areas_of_investigation', [])
+
+    expanded = doc.get('category_comparison_expanded')
+    expanded = expanded if isinstance(expanded, dict) else {}
+    expanded.setdefault('primary_competitors', [])
+    matrix = expanded.get('competitive_matrix')
+    matrix = matrix if isinstance(matrix, dict) else {}
+    matrix.setdefault('columns', [])
+    matrix.setdefault('rows', {})
+    expanded['competitive_matrix'] = matrix
+    expanded.setdefault('conclusion', '')
+    doc['category_comparison_expanded'] = expanded
+
+
+def _normalize_final_recommendation(doc):
+    recommendation = doc.get('final_recommendation')
+    if recommendation is None and doc.get('recommendation'):
+        # analyze_submission() output: flat recommendation fields
+        recommendation = {
+            'status': doc['recommendation'],
+            'rationale': doc.get('recommendation_rationale') or 'See detailed analysis for rationale.',
+            'key_factors': doc.get('key_factors', []),
+            'next_steps': doc.get('next_steps', []),
+        }
+    elif isinstance(recommendation, str):
+        recommendation = {'status': recommendation, 'rationale': 'See detailed analysis for rationale.'}
+    elif not isinstance(recommendation, dict):
+        recommendation = {'status': 'Pending', 'rationale': 'Final recommendation is pending review.'}
+
+    recommendation.setdefault('status', 'Pending')
+    recommendation.setdefault('rationale', '')
+    for key in ('key_factors', 'next_steps'):
+        if not isinstance(recommendation.get(key), list):
+            recommendation[key] = []
+    doc['final_recommendation'] = recommendation
+
+
+def normalize_analysis(analysis: dict) -> dict:
+    """
+    Convert an analysis in any historical shape into the canonical schema
+
+    Args:
+        analysis: parsed analysis document (not modified)
+
+    Returns:
+        A canonical document with schema_version set
+    """
+    if not isinstance(analysis, dict):
+        return analysis
+    if analysis.get('schema_version') == SCHEMA_VERSION:
+        return analysis
+
+    doc = copy.deepcopy(analysis)
+    is_legacy = not any(isinstance(doc.get(t), dict) for t in SIX_TS) and '6Ts' not in doc
+
+    _lift_top_level_fields(doc)
+    _normalize_six_ts(doc)
+    if is_legacy:
+        _normalize_legacy_sections(doc)
+    _normalize_final_recommendation(doc)
+
+    doc['schema_version'] = SCHEMA_VERSION
+    return doc
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Canonical analysis schema tools')
+    parser.add_argument('command', choices=['migrate'], help='"migrate" rewrites analysis files in canonical form')
+    parser.add_argument('--dir', default=str(ANALYSIS_DIR), help='Directory of *_analysis.json files')
+    args = parser.parse_args()
+
+    migrated = 0
+    for analysis_file in sorted(Path(args.dir).glob('*_analysis.json')):
+        with open(analysis_file, 'r', encoding='utf-8') as f:
+            analysis = json.load(f)
+        canonical = normalize_analysis(analysis)
+        if canonical is analysis:
+            continue
+        with open(analysis_file, 'w', encoding='utf-8') as f:
+            json.dump(canonical, f, indent=2)
+        migrated += 1
+    print(f"Migrated {migrated} analyses to schema version {SCHEMA_VERSION}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Packed Corpus Snapshot for SemperVirens Accelerator
+Packs every analysis into one file with an offset table so a cold process can
+memory-map it instead of opening each JSON file. The catalog decodes a record
+only when that analysis is first used.
+
+File layout:
+    8 bytes   magic (b'SVASNAP1')
+    8 bytes   little-endian length of the offset table
+    N bytes   offset table, UTF-8 JSON:
+              {"version", "schema_version", "card_version", "build_id", "records":
+               {filename: {offset, length, mtime_ns, size, sha1, company_name, token, card}}}
+    ...       canonical analysis documents as compact JSON, back to back
+
+Usage:
+    python analysis_snapshot.py build              # pack analysis/ into analysis/corpus.snapshot
+    python analysis_snapshot.py build --out PATH
+
+The Vercel build step runs the build, stamping the snapshot with the commit
+being deployed (VERCEL_GIT_COMMIT_SHA). A process started from that same
+commit trusts every record whose size matches, since a fresh checkout gives
+every file a new mtime; anywhere else records must match size and mtime,
+and files changed after the build are simply read from disk again.
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from analysis_catalog import CARD_INDEX_VERSION, card_summary
+from analysis_schema import SCHEMA_VERSION, normalize_analysis
+from sva_logging import configure_logging, get_logger
+
+log = get_logger('snapshot')
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent
+ANALYSIS_DIR = PROJECT_ROOT / "analysis"
+SNAPSHOT_PATH = ANALYSIS_DIR / "corpus.snapshot"
+
+# Identifies the deployed commit at build time and at run time
+BUILD_ID_ENV = 'VERCEL_GIT_COMMIT_SHA'
+
+MAGIC = b'SVASNAP1'
+SNAPSHOT_VERSION = 2
+_HEADER = struct.Struct('<8sQ')
+
+
+def build_snapshot(analysis_dir: Path = ANALYSIS_DIR, out_path: Path = SNAPSHOT_PATH,
+                   pattern: str = '_analysis.json', build_id: Optional[str] = None) -> int:
+    """
+    Pack every analysis file in a directory into a snapshot, stamped with
+    build_id (default: $VERCEL_GIT_COMMIT_SHA, if set)
+
+    Returns:
+        Number of analyses packed
+    """
+    records: Dict[str, dict] = {}
+    blobs = []
+    offset = 0
+
+    for analysis_file in sorted(Path(analysis_dir).glob(f'*{pattern}')):
+        stat = analysis_file.stat()
+        try:
+            with open(analysis_file, 'rb') as f:
+                raw = f.read()
+            analysis = json.loads(raw)
+        except Exception as e:
+            log.warning("Error reading %s: %s", analysis_file, e)
+            continue
+        if not isinstance(analysis, dict):
+            continue
+
+        blob = json.dumps(normalize_analysis(analysis), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        records[analysis_file.name] = {
+            'offset': offset,
+            'length': len(blob),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha1': hashlib.sha1(raw).hexdigest(),
+            'company_name': analysis.get('company_name', ''),
+            'token': analysis.get('token') or '',
+            'card': card_summary(analysis),
+        }
+        blobs.append(blob)
+        offset += len(blob)
+
+    table = json.dumps({'version': SNAPSHOT_VERSION, 'schema_version': SCHEMA_VERSION,
+                        'card_version': CARD_INDEX_VERSION,
+                        'build_id': build_id or os.getenv(BUILD_ID_ENV) or None, 'records': records},
+                       ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    tmp_path = Path(out_path).with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, len(table)))
+        f.write(table)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, out_path)
+    return len(records)
+
+
+class AnalysisSnapshot:
+    """
+    Read-only, memory-mapped view of a snapshot file.
+
+    Records are matched to files on disk by size and mtime. When the
+    snapshot's build_id equals this process's (both default to
+    $VERCEL_GIT_COMMIT_SHA), it was built from the files being served and
+    the mtime check is skipped.
+    """
+
+    def __init__(self, path: Path = SNAPSHOT_PATH, build_id: Optional[str] = None):
+        self.path = Path(path)
+        self.build_id = build_id or os.getenv(BUILD_ID_ENV) or None
+        self._map: Optional[mmap.mmap] = None
+        self._records: Dict[str, dict] = {}
+        self._trusted = False
+        self._cards_current = False
+        self._data_start = 0
+        self._stat = None
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Map the snapshot file, re-mapping it if it was rebuilt"""
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+            except OSError:
+                self._close()
+                return
+            key = (stat.st_mtime_ns, stat.st_size)
+            if key == self._stat:
+                return
+            self._close()
+            try:
+                self._open()
+                self._stat = key
+            except (OSError, ValueError) as e:
+                log.warning("Ignoring corpus snapshot %s: %s", self.path, e)
+                self._close()
+
+    def _open(self):
+        with open(self.path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, table_length = _HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC:
+            mapped.close()
+            raise ValueError("not a corpus snapshot")
+        table = json.loads(mapped[_HEADER.size:_HEADER.size + table_length])
+        if table.get('version') != SNAPSHOT_VERSION or table.get('schema_version') != SCHEMA_VERSION:
+            mapped.close()
+            raise ValueError("snapshot was built for a different format version")
+        self._map = mapped
+        self._records = table['records']
+        self._trusted = self.build_id is not None and table.get('build_id') == self.build_id
+        self._cards_current = table.get('card_version') == CARD_INDEX_VERSION
+        self._data_start = _HEADER.size + table_length
+
+    def _close(self):
+        if self._map is not None:
+            self._map.close()
+        self._map = None
+        self._records = {}
+        self._trusted = False
+        self._stat = None
+
+    def record(self, filename: str, mtime_ns: int, size: int) -> Optional[dict]:
+        """Offset-table record for a file, if the snapshot holds the current version of it"""
+        record = self._records.get(filename)
+        if record is None or record['size'] != size:
+            return None
+        if not self._trusted and record['mtime_ns'] != mtime_ns:
+            return None
+        return record
+
+    def card(self, filename: str, mtime_ns: int, size: int) -> Optional[dict]:
+        """Prebuilt card summary for a file, if the snapshot holds the current version of it"""
+        record = self.record(filename, mtime_ns, size)
+        return record.get('card') if record is not None and self._cards_current else None
+
+    def read(self, filename: str) -> Optional[bytes]:
+        """Raw JSON bytes of one packed analysis"""
+        with self._lock:
+            record = self._records.get(filename)
+            if record is None or self._map is None:
+                return None
+            start = self._data_start + record['offset']
+            return self._map[start:start + record['length']]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Packed corpus snapshot tools')
+    parser.add_argument('command', choices=['build'], help='"build" packs analysis/ into a snapshot file')
+    parser.add_argument('--dir', default=str(ANALYSIS_DIR), help='Directory of *_analysis.json files')
+    parser.add_argument('--out', default=str(SNAPSHOT_PATH), help='Snapshot file to write')
+    args = parser.parse_args()
+    configure_logging()
+
+    packed = build_snapshot(Path(args.dir), Path(args.out))
+    print(f"Packed {packed} analyses into {args.out}")
+
+if __name__ == "__main__":
+    main()
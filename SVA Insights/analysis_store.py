@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+SQLite Analysis Store for SemperVirens Accelerator
+Holds every analysis as a JSON document with indexed columns for the fields
+the dashboard filters and sorts on, an FTS5 full-text index over every text
+field, plus an importer for the flat-file corpus. Deployments run the
+importer in the Vercel build step; otherwise the web app imports the corpus
+itself the first time it needs a store that doesn't exist yet.
+
+Usage:
+    python analysis_store.py import            # import analysis/ and analysis/legacy/
+    python analysis_store.py import --db PATH  # import into a different database
+"""
+
+import argparse
+import html
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from analysis_catalog import SIX_TS, card_summary, company_slug, parse_submitted_at, section_score
+from analysis_schema import normalize_analysis
+from sva_logging import configure_logging, get_logger
+
+log = get_logger('store')
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent
+ANALYSIS_DIR = PROJECT_ROOT / "analysis"
+STORE_PATH = PROJECT_ROOT / "data_lake" / "analyses.db"
+
+SCORE_COLUMNS = [f"{t}_score" for t in SIX_TS]
+
+SCHEMA = f'''
+    CREATE TABLE IF NOT EXISTS analyses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT NOT NULL UNIQUE,
+        source TEXT NOT NULL,
+        token TEXT,
+        company_name TEXT,
+        normalized_name TEXT,
+        submitted_at TEXT,
+        {', '.join(f'{c} REAL' for c in SCORE_COLUMNS)},
+        recommendation TEXT,
+        document TEXT NOT NULL CHECK (json_valid(document)),
+        updated_at TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_analyses_token ON analyses(token);
+    CREATE INDEX IF NOT EXISTS idx_analyses_normalized_name ON analyses(normalized_name);
+    CREATE INDEX IF NOT EXISTS idx_analyses_submitted_at ON analyses(submitted_at);
+    CREATE INDEX IF NOT EXISTS idx_analyses_recommendation ON analyses(recommendation);
+    {' '.join(f'CREATE INDEX IF NOT EXISTS idx_analyses_{c} ON analyses({c});' for c in SCORE_COLUMNS)}
+    CREATE VIRTUAL TABLE IF NOT EXISTS analysis_text USING fts5(
+        filename UNINDEXED,
+        path UNINDEXED,
+        body,
+        tokenize = 'porter unicode61'
+    );
+'''
+
+# Top-level fields that are identifiers or links rather than prose
+UNSEARCHED_FIELDS = {'token', 'submitted_at', 'website', 'year_founded', 'pitch_deck_link', 'demo_link',
+                     'schema_version', 'timestamp', 'linkedin'}
+
+# Snippet highlight markers; swapped for <mark> after HTML-escaping
+_MARK_START, _MARK_END = '\x02', '\x03'
+
+# Columns written out by export_rows(), in CSV order
+EXPORT_COLUMNS = ['company_name', 'token', 'submitted_at', *SCORE_COLUMNS, 'recommendation', 'filename']
+
+
+def text_fields(document, path: str = '') -> Iterator[Tuple[str, str]]:
+    """
+    Yield (path, text) for every string in a document
+
+    Paths are dotted keys without list indexes, e.g. "traction.red_flags" or
+    "team.founder_deep_dive.background".
+    """
+    if isinstance(document, dict):
+        for key, value in document.items():
+            if key in UNSEARCHED_FIELDS:
+                continue
+            yield from text_fields(value, f"{path}.{key}" if path else key)
+    elif isinstance(document, list):
+        for item in document:
+            yield from text_fields(item, path)
+    elif isinstance(document, str) and document.strip() and path:
+        yield path, document
+
+
+def fts_query(q: str) -> str:
+    """
+    Turn a search box query into a safe FTS5 expression
+
+    Words and "quoted phrases" must all match; a trailing * keeps prefix search,
+    and OR between terms is passed through.
+    """
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', q or ''):
+        if word == 'OR' and terms and terms[-1] != 'OR':
+            terms.append('OR')
+            continue
+        text = (phrase or word).replace('"', '')
+        prefix = word.endswith('*')
+        text = text.rstrip('*').strip()
+        if text:
+            terms.append(f'"{text}"' + ('*' if prefix else ''))
+    while terms and terms[-1] == 'OR':
+        terms.pop()
+    return ' '.join(terms)
+
+
+def highlight(snippet: str) -> str:
+    """HTML-escape an FTS snippet and turn its markers into <mark> tags"""
+    return html.escape(snippet).replace(_MARK_START, '<mark>').replace(_MARK_END, '</mark>')
+
+
+class AnalysisStore:
+    """Thin wrapper around the analyses table; each call opens its own connection"""
+
+    def __init__(self, db_path: Path = STORE_PATH):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._failed = False
+
+    def exists(self) -> bool:
+        return self.db_path.exists()
+
+    def ensure(self) -> bool:
+        """
+        Create the store and import the corpus if it doesn't exist yet. The
+        import goes to a temporary file that replaces the database when
+        complete, so readers never see a half-imported store; a failed
+        import isn't retried in the same process.
+
+        Returns:
+            Whether the store is available
+        """
+        if self.exists():
+            return True
+        with self._lock:
+            if self.exists():
+                return True
+            if self._failed:
+                return False
+            tmp_path = self.db_path.with_suffix('.tmp')
+            try:
+                tmp_path.unlink(missing_ok=True)
+                comprehensive, legacy = AnalysisStore(tmp_path).import_corpus()
+                os.replace(tmp_path, self.db_path)
+            except (OSError, sqlite3.Error) as e:
+                log.warning("Could not create analysis store %s: %s", self.db_path, e)
+                self._failed = True
+                return False
+            log.info("Created analysis store %s", self.db_path,
+                     extra={'fields': {'comprehensive': comprehensive, 'legacy': legacy}})
+            return True
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def create(self):
+        """Create the analyses table and its indexes if they don't exist"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+        conn.close()
+
+    def upsert(self, filename: str, analysis: dict, source: str = 'comprehensive'):
+        """Insert or replace the row for an analysis file, stored in canonical form"""
+        self._ensure_schema()
+        with self._connect() as conn:
+            self._upsert(conn, filename, analysis, source)
+        conn.close()
+
+    def _upsert(self, conn: sqlite3.Connection, filename: str, analysis: dict, source: str):
+        analysis = normalize_analysis(analysis)
+        submitted_at = parse_submitted_at(analysis.get('submitted_at'))
+        company_name = analysis.get('company_name', '')
+        row = {
+            'filename': filename,
+            'source': source,
+            'token': (analysis.get('token') or '').strip() or None,
+            'company_name': company_name,
+            'normalized_name': company_slug(company_name),
+            'submitted_at': submitted_at.isoformat(sep=' ') if submitted_at else None,
+            **{f"{t}_score": section_score(analysis, t) for t in SIX_TS},
+            'recommendation': card_summary(analysis)['status'] or None,
+            'document': json.dumps(analysis, ensure_ascii=False),
+            'updated_at': datetime.now().isoformat(),
+        }
+        columns = ', '.join(row)
+        placeholders = ', '.join(f':{c}' for c in row)
+        updates = ', '.join(f'{c} = excluded.{c}' for c in row if c != 'filename')
+        conn.execute(
+            f'INSERT INTO analyses ({columns}) VALUES ({placeholders}) '
+            f'ON CONFLICT(filename) DO UPDATE SET {updates}',
+            row
+        )
+        self._index_text(conn, filename, analysis)
+
+    def _index_text(self, conn: sqlite3.Connection, filename: str, analysis: dict):
+        """Replace the full-text rows of one analysis"""
+        conn.execute('DELETE FROM analysis_text WHERE filename = ?', (filename,))
+        conn.executemany(
+            'INSERT INTO analysis_text (filename, path, body) VALUES (?, ?, ?)',
+            [(filename, path, text) for path, text in text_fields(analysis)]
+        )
+
+    def _ensure_schema(self):
+        """
+        Apply the schema once per process. Databases imported before the
+        full-text index existed get it backfilled from their documents.
+        """
+        if getattr(self, '_schema_checked', False):
+            return
+        self.create()
+        with self._connect() as conn:
+            if conn.execute('SELECT 1 FROM analysis_text LIMIT 1').fetchone() is None:
+                for row in conn.execute('SELECT filename, document FROM analyses').fetchall():
+                    self._index_text(conn, row['filename'], json.loads(row['document']))
+        conn.close()
+        self._schema_checked = True
+
+    def import_directory(self, directory: Path, source: str) -> int:
+        """
+        Import every *_analysis.json file in a directory in one transaction;
+        returns the number imported
+        """
+        imported = 0
+        self._ensure_schema()
+        with self._connect() as conn:
+            for analysis_file in sorted(Path(directory).glob('*_analysis.json')):
+                try:
+                    with open(analysis_file, 'r', encoding='utf-8') as f:
+                        analysis = json.load(f)
+                except Exception as e:
+                    log.warning("Error reading %s: %s", analysis_file, e)
+                    continue
+                if not isinstance(analysis, dict):
+                    continue
+                self._upsert(conn, analysis_file.name, analysis, source)
+                imported += 1
+        conn.close()
+        return imported
+
+    def import_corpus(self, analysis_dir: Path = ANALYSIS_DIR) -> Tuple[int, int]:
+        """Create the store and import analysis/ and analysis/legacy/; returns both counts"""
+        self.create()
+        return (self.import_directory(analysis_dir, 'comprehensive'),
+                self.import_directory(Path(analysis_dir) / 'legacy', 'legacy'))
+
+    def tokens(self) -> set:
+        with self._connect() as conn:
+            rows = conn.execute('SELECT token FROM analyses WHERE token IS NOT NULL').fetchall()
+        conn.close()
+        return {r['token'] for r in rows}
+
+    def get(self, slug: str) -> Optional[dict]:
+        """Fetch a document by normalized company name or token, preferring comprehensive analyses"""
+        key = company_slug(slug)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT document FROM analyses WHERE normalized_name = ? OR token = ? "
+                "ORDER BY source = 'comprehensive' DESC, updated_at DESC LIMIT 1",
+                (key, key)
+            ).fetchone()
+        conn.close()
+        return normalize_analysis(json.loads(row['document'])) if row else None
+
+    def query(self, min_scores: Optional[Dict[str, float]] = None, recommendation: Optional[str] = None,
+              source: str = 'comprehensive') -> List[dict]:
+        """
+        Score/recommendation filter over the indexed columns
+
+        Args:
+            min_scores: mapping of 6T name to minimum score, e.g. {'team': 4}
+            recommendation: exact recommendation status to match
+
+        Returns:
+            Rows (without the document) ordered by submission date
+        """
+        clauses = ['source = ?']
+        params: list = [source]
+        for t, minimum in (min_scores or {}).items():
+            if t not in SIX_TS:
+                raise ValueError(f"Unknown 6T: {t}")
+            clauses.append(f'{t}_score >= ?')
+            params.append(minimum)
+        if recommendation:
+            clauses.append('recommendation = ?')
+            params.append(recommendation)
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(EXPORT_COLUMNS)} FROM analyses WHERE {' AND '.join(clauses)} "
+                "ORDER BY submitted_at",
+                params
+            ).fetchall()
+        conn.close()
+        return [dict(r) for r in rows]
+
+    def search(self, q: str, field: Optional[str] = None, limit: int = 50) -> List[dict]:
+        """
+        Full-text search over every text field, ranked by BM25
+
+        Args:
+            q: search box query (see fts_query)
+            field: restrict matches to a dotted path or its children, e.g.
+                "traction" or "traction.red_flags"
+            limit: maximum number of analyses returned
+
+        Returns:
+            One dict per analysis, best first, with up to three highlighted snippets
+        """
+        expression = fts_query(q)
+        if not expression or not self.exists():
+            return []
+        self._ensure_schema()
+
+        clauses = ['analysis_text MATCH ?']
+        params: list = [_MARK_START, _MARK_END, expression]
+        if field:
+            clauses.append("(t.path = ? OR t.path LIKE ? ESCAPE '\\')")
+            params += [field, field.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '.%']
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT t.filename, t.path, snippet(analysis_text, 2, ?, ?, '…', 16) AS snippet, "
+                "bm25(analysis_text) AS rank, a.company_name, a.source "
+                "FROM analysis_text t JOIN analyses a ON a.filename = t.filename "
+                f"WHERE {' AND '.join(clauses)} ORDER BY rank",
+                params
+            ).fetchall()
+        conn.close()
+
+        results: Dict[str, dict] = {}
+        for row in rows:
+            result = results.get(row['filename'])
+            if result is None:
+                if len(results) >= limit:
+                    continue
+                result = results[row['filename']] = {
+                    'company_name': row['company_name'],
+                    'slug': company_slug(row['company_name']),
+                    'filename': row['filename'],
+                    'source': row['source'],
+                    'score': 0.0,
+                    'matches': [],
+                }
+            # bm25() is lower-is-better; report a positive relevance score
+            result['score'] += -row['rank']
+            if len(result['matches']) < 3:
+                result['matches'].append({'path': row['path'], 'snippet': highlight(row['snippet'])})
+
+        return sorted(results.values(), key=lambda r: r['score'], reverse=True)
+
+    def export_rows(self) -> List[dict]:
+        """All comprehensive analyses as flat export rows"""
+        return self.query()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SemperVirens analysis store')
+    parser.add_argument('command', choices=['import'], help='"import" loads analysis/ and analysis/legacy/ into SQLite')
+    parser.add_argument('--db', default=str(STORE_PATH), help='Path to the SQLite database')
+    args = parser.parse_args()
+    configure_logging()
+
+    store = AnalysisStore(Path(args.db))
+    comprehensive, legacy = store.import_corpus()
+    print(f"Imported {comprehensive} comprehensive and {legacy} legacy analyses into {store.db_path}")
+
+if __name__ == "__main__":
+    main()
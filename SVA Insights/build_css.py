@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Stylesheet Build for SemperVirens Accelerator
+Compiles static/css/styles.css with Tailwind into one purged, minified file
+containing only the classes the templates use, and writes it under a
+content-hashed name so it can be cached forever.
+
+Output:
+    static/css/app.<hash>.css    the bundle (older bundles are removed)
+    static/css/manifest.json     {"app.css": "app.<hash>.css"}, read by sva.py
+
+Usage:
+    python build_css.py          # uses a `tailwindcss` binary on PATH, else `npx tailwindcss@3`
+
+vercel.json runs it as the build command, so every deployment ships a bundle
+built from its own templates; the outputs are not committed. Run it locally
+to preview the bundle; without a manifest, local pages fall back to the
+Tailwind CDN compiler.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from sva_logging import configure_logging, get_logger
+
+log = get_logger('build_css')
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent
+CSS_DIR = PROJECT_ROOT / "static" / "css"
+SOURCE_PATH = CSS_DIR / "styles.css"
+CONFIG_PATH = PROJECT_ROOT / "tailwind.config.js"
+MANIFEST_PATH = CSS_DIR / "manifest.json"
+
+BUNDLE_NAME = 'app.css'
+
+
+def tailwind_command() -> list:
+    """The standalone Tailwind CLI if installed, otherwise the npm package through npx"""
+    binary = shutil.which('tailwindcss')
+    if binary:
+        return [binary]
+    return ['npx', '--yes', 'tailwindcss@3']
+
+
+def build_css() -> str:
+    """
+    Compile, fingerprint and register the stylesheet bundle
+
+    Returns:
+        Filename of the bundle, relative to static/css
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        out_path = Path(tmp_dir) / BUNDLE_NAME
+        command = tailwind_command() + ['--config', str(CONFIG_PATH), '--input', str(SOURCE_PATH),
+                                        '--output', str(out_path), '--minify']
+        log.info("Running %s", ' '.join(command))
+        subprocess.run(command, cwd=PROJECT_ROOT, check=True)
+        css = out_path.read_bytes()
+
+    stem, suffix = os.path.splitext(BUNDLE_NAME)
+    filename = f"{stem}.{hashlib.sha1(css).hexdigest()[:10]}{suffix}"
+    (CSS_DIR / filename).write_bytes(css)
+
+    for old in CSS_DIR.glob(f"{stem}.*{suffix}"):
+        if old.name != filename:
+            old.unlink()
+
+    tmp_manifest = MANIFEST_PATH.with_suffix('.tmp')
+    with open(tmp_manifest, 'w', encoding='utf-8') as f:
+        json.dump({BUNDLE_NAME: filename}, f, indent=2)
+    os.replace(tmp_manifest, MANIFEST_PATH)
+    return filename
+
+
+def main():
+    configure_logging()
+    try:
+        filename = build_css()
+    except (OSError, subprocess.CalledProcessError) as e:
+        log.error("Stylesheet build failed: %s", e)
+        sys.exit(1)
+    size = (CSS_DIR / filename).stat().st_size
+    print(f"Wrote static/css/{filename} ({size / 1024:.1f} KB)")
+
+if __name__ == "__main__":
+    main()
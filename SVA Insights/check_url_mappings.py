@@ -1,83 +1,52 @@
 #!/usr/bin/env python3
 """
 Check URL mappings for all companies to ensure routing works correctly.
-This script compares the URL format generated by the index template with actual filenames.
+This script resolves each company's URL slug and token through the same
+AnalysisCatalog the web app uses and reports anything that does not route
+back to its own analysis file.
 """
 
-import json
-import os
 from pathlib import Path
 
-def normalize_url_name(company_name):
-    """Simulate the URL normalization done in the index template"""
-    return company_name.lower().replace(' ', '').replace('-', '').replace('_', '').replace('.', '').replace(',', '')
-
-def get_filename_from_company_name(company_name):
-    """Convert company name to expected filename format"""
-    return company_name.lower().replace(' ', '_').replace('-', '_').replace('.', '').replace(',', '')
+from analysis_catalog import AnalysisCatalog, company_slug
 
 def main():
-    analysis_dir = Path("analysis")
-    
-    # Get all comprehensive analysis files
-    analysis_files = list(analysis_dir.glob('*_comprehensive_analysis.json'))
-    
+    catalog = AnalysisCatalog(Path("analysis"))
+
     print("=== URL MAPPING CHECK ===\n")
-    
-    # Load company names from analysis files
-    companies_data = []
-    
-    for file_path in analysis_files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                company_name = data.get('company_name', '')
-                if company_name:
-                    companies_data.append({
-                        'company_name': company_name,
-                        'filename': file_path.name,
-                        'file_stem': file_path.stem.replace('_comprehensive_analysis', '')
-                    })
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
-    
-    # Sort by company name
-    companies_data.sort(key=lambda x: x['company_name'])
-    
-    missing_mappings = []
-    
-    print("Company Name -> URL -> Expected Filename -> Actual Filename -> Status")
+
+    entries = catalog.entries('_comprehensive_analysis.json')
+    entries.sort(key=lambda e: e.data.get('company_name', ''))
+
+    unresolved = []
+
+    print("Company Name -> URL -> Actual Filename -> Resolved Filename -> Status")
     print("-" * 80)
-    
-    for company in companies_data:
-        company_name = company['company_name']
-        url_name = normalize_url_name(company_name)
-        expected_filename = f"{get_filename_from_company_name(company_name)}_comprehensive_analysis.json"
-        actual_filename = company['filename']
-        
-        # Check if URL name would find the correct file
-        # The routing looks for files like: {url_name}_comprehensive_analysis.json
-        expected_by_routing = f"{url_name}_comprehensive_analysis.json"
 
-        if expected_by_routing == actual_filename:
+    for entry in entries:
+        company_name = entry.data.get('company_name', '')
+        if not company_name:
+            continue
+        url_name = company_slug(company_name)
+        resolved = catalog.resolve(url_name)
+        resolved_name = resolved.name if resolved else 'NOT FOUND'
+
+        if resolved and resolved.data.get('company_name') == company_name:
             status = "✅ OK"
         else:
-            status = "❌ NEEDS MAPPING"
-            missing_mappings.append({
-                'url_name': url_name,
-                'actual_filename': actual_filename
-            })
-        
-        print(f"{company_name:<25} -> {url_name:<20} -> {expected_filename:<35} -> {actual_filename:<35} -> {status}")
-    
+            status = "❌ UNRESOLVED"
+            unresolved.append((url_name, entry.name, resolved_name))
+
+        print(f"{company_name:<25} -> {url_name:<20} -> {entry.name:<35} -> {resolved_name:<35} -> {status}")
+
     print(f"\n=== SUMMARY ===")
-    print(f"Total companies: {len(companies_data)}")
-    print(f"Need special mappings: {len(missing_mappings)}")
-    
-    if missing_mappings:
-        print(f"\n=== REQUIRED SPECIAL CASE MAPPINGS ===")
-        for mapping in missing_mappings:
-            print(f'        "{mapping["url_name"]}": "{mapping["actual_filename"]}",')
+    print(f"Total companies: {len(entries)}")
+    print(f"Unresolved: {len(unresolved)}")
+
+    if unresolved:
+        print(f"\n=== UNRESOLVED URLS ===")
+        for url_name, actual, resolved_name in unresolved:
+            print(f"  {url_name}: expected {actual}, got {resolved_name}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Response Compression for SemperVirens Accelerator
+Negotiates brotli or gzip per request and compresses text responses,
+streamed ones chunk by chunk so they still flush progressively. Whole bodies
+are cached compressed by content hash, so a page or API payload served
+again unchanged isn't compressed again. brotli is an optional dependency;
+without it only gzip is offered.
+"""
+
+import gzip
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional
+
+try:
+    import brotli
+except ImportError:  # optional; gzip covers every browser
+    brotli = None
+
+# Preferred first
+ENCODINGS = ['br', 'gzip'] if brotli is not None else ['gzip']
+
+COMPRESSIBLE_TYPES = {
+    'text/html', 'text/css', 'text/plain', 'text/csv', 'text/javascript',
+    'application/json', 'application/javascript', 'image/svg+xml',
+}
+
+# Below this a compressed body saves less than the header costs
+MIN_SIZE = 512
+
+# Per-request levels favour speed; static files are compressed once at the maximum
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Compressed bodies kept, least recently used dropped first
+CACHE_ENTRIES = 128
+
+_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def negotiate(accept_encodings, offered: Iterable[str] = ENCODINGS) -> Optional[str]:
+    """The first offered encoding the client accepts, or None for identity"""
+    for encoding in offered:
+        if accept_encodings[encoding] > 0:
+            return encoding
+    return None
+
+
+def etag_variants(etag: str, accept_encodings) -> List[str]:
+    """
+    The tags a client may hold for one representation: the identity ETag and
+    one per encoding it accepts (compressed bodies carry "<etag>-<encoding>")
+    """
+    return [etag] + [f"{etag}-{encoding}" for encoding in ENCODINGS if accept_encodings[encoding] > 0]
+
+
+def compress(data: bytes, encoding: str, best: bool = False) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(data, quality=11 if best else BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=9 if best else GZIP_LEVEL, mtime=0)
+
+
+def compress_cached(data: bytes, encoding: str) -> bytes:
+    """compress() through the LRU of recent bodies, keyed by their SHA-1"""
+    key = (hashlib.sha1(data).digest(), encoding)
+    with _cache_lock:
+        body = _cache.get(key)
+        if body is not None:
+            _cache.move_to_end(key)
+            return body
+
+    body = compress(data, encoding)
+    with _cache_lock:
+        _cache[key] = body
+        while len(_cache) > CACHE_ENTRIES:
+            _cache.popitem(last=False)
+    return body
+
+
+def compress_chunks(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """Compress a streamed body, flushing after every chunk"""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        for chunk in chunks:
+            out = compressor.process(chunk) + compressor.flush()
+            if out:
+                yield out
+        yield compressor.finish()
+        return
+
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        out = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if out:
+            yield out
+    yield compressor.flush()
+
+
+def compress_response(response, accept_encodings):
+    """
+    Compress a Flask response in place if its type, size and the client allow
+
+    Strong ETags get the encoding appended, since the compressed body is a
+    different byte sequence; conditional_response matches either form.
+    """
+    if response.mimetype not in COMPRESSIBLE_TYPES and response.status_code != 304:
+        return response
+    response.vary.add('Accept-Encoding')
+    if (response.status_code in (204, 206, 304) or response.direct_passthrough
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    encoding = negotiate(accept_encodings)
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = compress_chunks(response.iter_encoded(), encoding)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < MIN_SIZE:
+            return response
+        response.set_data(compress_cached(data, encoding))
+
+    response.headers['Content-Encoding'] = encoding
+    tag, weak = response.get_etag()
+    if tag and not weak:
+        response.set_etag(f"{tag}-{encoding}")
+    return response
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Detection for SemperVirens Accelerator
+MinHash signatures over each applicant's submission text, banded into an LSH
+table, plus exact lookups on website domain and founder name. Used to stop
+a resubmitted company being sent to OpenAI again at sync time, and to list
+the duplicates already on disk (comprehensive and legacy) for cleanup.
+
+The signatures use integer arithmetic only, so the optional NumPy path and
+the pure-Python one produce identical results.
+"""
+
+import random
+import re
+import threading
+import zlib
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from submission_index import tokenize
+
+try:
+    import numpy as np
+except ImportError:  # optional; the pure-Python path gives the same signatures
+    np = None
+
+# 16 bands of 4 rows: pairs above ~0.5 Jaccard almost always share a bucket
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+
+# Reported as a text duplicate at or above this (exact) Jaccard similarity
+THRESHOLD = 0.6
+
+# Word n-grams the text is shingled into
+SHINGLE_SIZE = 3
+
+_PRIME = (1 << 31) - 1
+_rng = random.Random(20250516)
+_A = [_rng.randrange(1, _PRIME) for _ in range(NUM_PERM)]
+_B = [_rng.randrange(0, _PRIME) for _ in range(NUM_PERM)]
+
+# Domains that say nothing about which company a submission is
+GENERIC_DOMAINS = frozenset({
+    'linkedin.com', 'google.com', 'docs.google.com', 'drive.google.com', 'notion.site',
+    'facebook.com', 'instagram.com', 'x.com', 'twitter.com', 'example.com',
+})
+
+# Placeholders the schema and the sheet use for "no founder"
+_NO_FOUNDER = frozenset({'', 'not available', 'unknown', 'n a', 'na', 'none', 'founder name'})
+
+# Sheet columns of a new submission
+SHEET_DESCRIPTION = 'Describe your company (Word limit - 50)'
+SHEET_PROBLEM = 'What problem are you solving, and why does it matter'
+SHEET_WEBSITE = 'Company website'
+SHEET_FOUNDERS = 'Name and title of co-founders (Please include LinkedIn profiles)'
+
+
+def website_domain(url) -> str:
+    """Bare domain of a website ("https://www.counterfin.com/about" -> "counterfin.com"), '' if generic"""
+    if not isinstance(url, str):
+        return ''
+    domain = re.sub(r'^[a-z][a-z0-9+.-]*://', '', url.strip().lower()).split('/')[0].split('?')[0]
+    domain = domain.split('@')[-1].split(':')[0]
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    if '.' not in domain or domain in GENERIC_DOMAINS:
+        return ''
+    return domain
+
+
+def founder_key(name) -> str:
+    """
+    Normalized name of the first founder; for the sheet's free-text founders
+    column, the text before the first title, link or separator
+    """
+    if not isinstance(name, str):
+        return ''
+    first = re.split(r'[,;:\n(|/]|\s[-–—]\s|https?://', name.strip(), maxsplit=1)[0]
+    key = ' '.join(tokenize(first)[:3])
+    return '' if key in _NO_FOUNDER else key
+
+
+def shingles(*texts) -> FrozenSet[str]:
+    """Word SHINGLE_SIZE-grams of the texts (single words if the text is shorter)"""
+    words = []
+    for text in texts:
+        words += tokenize(text if isinstance(text, str) else '')
+    if len(words) < SHINGLE_SIZE:
+        return frozenset(words)
+    return frozenset(' '.join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1))
+
+
+def minhash(features: Iterable[str]) -> Tuple[int, ...]:
+    """NUM_PERM-value MinHash signature of a non-empty feature set"""
+    hashes = [zlib.crc32(feature.encode('utf-8')) % _PRIME for feature in features]
+    if np is not None:
+        values = np.array(hashes, dtype=np.int64)
+        permuted = (np.array(_A, dtype=np.int64)[:, None] * values[None, :] + np.array(_B, dtype=np.int64)[:, None]) % _PRIME
+        return tuple(int(v) for v in permuted.min(axis=1))
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in zip(_A, _B))
+
+
+class Fingerprint:
+    """What a submission is compared on: text shingles and their MinHash, website domain, founder"""
+
+    __slots__ = ('shingles', 'signature', 'domain', 'founder')
+
+    def __init__(self, description='', problem_statement='', website='', founder=''):
+        self.shingles = shingles(description, problem_statement)
+        self.signature = minhash(self.shingles) if self.shingles else None
+        self.domain = website_domain(website)
+        self.founder = founder_key(founder)
+
+    def bands(self) -> List[Tuple[int, Tuple[int, ...]]]:
+        if self.signature is None:
+            return []
+        return [(band, self.signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]) for band in range(BANDS)]
+
+    def similarity(self, other: 'Fingerprint') -> float:
+        """Exact Jaccard similarity of the text shingles"""
+        if not self.shingles or not other.shingles:
+            return 0.0
+        return len(self.shingles & other.shingles) / len(self.shingles | other.shingles)
+
+
+def card_fingerprint(card: dict) -> Fingerprint:
+    return Fingerprint(card.get('description'), card.get('problem_statement'), card.get('website'), card.get('founder'))
+
+
+def submission_fingerprint(submission: dict) -> Fingerprint:
+    """Fingerprint of a spreadsheet row, before any analysis exists"""
+    return Fingerprint(submission.get(SHEET_DESCRIPTION), submission.get(SHEET_PROBLEM),
+                       submission.get(SHEET_WEBSITE), submission.get(SHEET_FOUNDERS))
+
+
+def _card_text(card: dict) -> tuple:
+    return tuple(card.get(field) or '' for field in ('description', 'problem_statement', 'website', 'founder'))
+
+
+class DuplicateIndex:
+    """
+    LSH table over fingerprints, keyed by caller-chosen ids.
+
+    Candidates are entries sharing a band of the MinHash signature, a
+    website domain or a founder; each is then confirmed with the exact
+    shingle similarity. Only text (>= THRESHOLD) and website matches block
+    a sync: a shared founder alone may be a serial founder, so it is
+    reported but not acted on.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Tuple[Fingerprint, dict]] = {}
+        self._buckets: Dict[tuple, List[str]] = defaultdict(list)
+        self._by_domain: Dict[str, List[str]] = defaultdict(list)
+        self._by_founder: Dict[str, List[str]] = defaultdict(list)
+        self._fingerprints: Dict[tuple, Fingerprint] = {}
+
+    def add(self, key: str, fingerprint: Fingerprint, meta: Optional[dict] = None):
+        with self._lock:
+            self.entries[key] = (fingerprint, meta or {})
+            for band in fingerprint.bands():
+                self._buckets[band].append(key)
+            if fingerprint.domain:
+                self._by_domain[fingerprint.domain].append(key)
+            if fingerprint.founder:
+                self._by_founder[fingerprint.founder].append(key)
+
+    def update(self, cards: Iterable[Tuple[str, dict]]) -> int:
+        """
+        Replace the entries with (key, card summary) pairs, reusing the
+        fingerprint of any card whose text is unchanged
+
+        Returns:
+            Number of fingerprints computed
+        """
+        with self._lock:
+            previous = self._fingerprints
+
+        # Built aside and swapped in, so lookups never see a partial table
+        fresh = DuplicateIndex()
+        computed = 0
+        for key, card in cards:
+            text = _card_text(card)
+            fingerprint = previous.get(text)
+            if fingerprint is None:
+                fingerprint = card_fingerprint(card)
+                computed += 1
+            fresh._fingerprints[text] = fingerprint
+            fresh.add(key, fingerprint, card)
+
+        with self._lock:
+            self.entries, self._buckets, self._by_domain, self._by_founder, self._fingerprints = (
+                fresh.entries, fresh._buckets, fresh._by_domain, fresh._by_founder, fresh._fingerprints)
+        return computed
+
+    def matches(self, fingerprint: Fingerprint, exclude: Optional[str] = None) -> List[dict]:
+        """
+        Entries that look like the same applicant, most similar first
+
+        Returns:
+            Dicts with the entry `key`, its `meta`, text `similarity` and
+            the `reasons` it matched on ('text', 'website', 'founder')
+        """
+        with self._lock:
+            candidates = set()
+            for band in fingerprint.bands():
+                candidates.update(self._buckets.get(band, ()))
+            website = set(self._by_domain.get(fingerprint.domain, ())) if fingerprint.domain else set()
+            founder = set(self._by_founder.get(fingerprint.founder, ())) if fingerprint.founder else set()
+            entries = {key: self.entries[key] for key in candidates | website | founder if key != exclude}
+
+        found = []
+        for key, (other, meta) in entries.items():
+            similarity = fingerprint.similarity(other)
+            reasons = [reason for reason, hit in (('text', similarity >= THRESHOLD), ('website', key in website),
+                                                  ('founder', key in founder)) if hit]
+            if reasons:
+                found.append({'key': key, 'meta': meta, 'similarity': round(similarity, 3), 'reasons': reasons})
+        found.sort(key=lambda match: (-len(match['reasons']), -match['similarity']))
+        return found
+
+    def pairs(self) -> List[dict]:
+        """Every pair of entries that match each other, each listed once"""
+        with self._lock:
+            keys = list(self.entries)
+        found = []
+        for key in keys:
+            for match in self.matches(self.entries[key][0], exclude=key):
+                if key < match['key']:
+                    found.append({'keys': [key, match['key']], 'similarity': match['similarity'],
+                                  'reasons': match['reasons']})
+        found.sort(key=lambda pair: (-len(pair['reasons']), -pair['similarity']))
+        return found
+
+
+def is_blocking(match: dict) -> bool:
+    """Whether a match is strong enough to skip generating an analysis"""
+    return 'text' in match['reasons'] or 'website' in match['reasons']
+
+
+def screen_submissions(index: DuplicateIndex, submissions: List[dict]) -> Tuple[List[dict], List[dict]]:
+    """
+    Split new spreadsheet rows into those worth analysing and near-duplicates
+    of an existing analysis or of an earlier row in the same batch
+
+    Returns:
+        (unique submissions, duplicate reports with the matched entry)
+    """
+    batch = DuplicateIndex()
+    unique, duplicates = [], []
+    for submission in submissions:
+        fingerprint = submission_fingerprint(submission)
+        blocking = [match for match in index.matches(fingerprint) + batch.matches(fingerprint) if is_blocking(match)]
+        if blocking:
+            best = blocking[0]
+            duplicates.append({
+                'company_name': submission.get('Company Name', ''),
+                'token': submission.get('Token', ''),
+                'duplicate_of': best['meta'].get('company_name') or best['key'],
+                'duplicate_key': best['key'],
+                'similarity': best['similarity'],
+                'reasons': best['reasons'],
+            })
+            continue
+        unique.append(submission)
+        batch.add(f"sheet:{submission.get('Token', '')}", fingerprint, {'company_name': submission.get('Company Name', '')})
+    return unique, duplicates
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+List near-duplicate analyses for cleanup: pairs of comprehensive and legacy
+analyses with near-identical submission text, the same website or the same
+founder, using the same MinHash/LSH index the sync uses to skip resubmissions.
+"""
+
+from pathlib import Path
+
+from analysis_catalog import CardIndex
+from duplicate_index import DuplicateIndex, THRESHOLD
+from sva_logging import configure_logging
+
+def main():
+    configure_logging()
+    analysis_dir = Path("analysis")
+    current = CardIndex(analysis_dir, analysis_dir / "card_index.json")
+    legacy = CardIndex(analysis_dir / "legacy", analysis_dir / "legacy" / "card_index.json", suffix='_analysis.json')
+
+    index = DuplicateIndex()
+    index.update([(f"analysis/{card['file']}", card) for card in current.cards()] +
+                 [(f"analysis/legacy/{card['file']}", card) for card in legacy.cards()])
+    pairs = index.pairs()
+
+    print("=== NEAR-DUPLICATE ANALYSES ===\n")
+    print(f"Analyses checked: {len(index.entries)}")
+    print(f"Text similarity threshold: {THRESHOLD:.0%}")
+    print(f"Pairs found: {len(pairs)}")
+
+    for pair in pairs:
+        names = [index.entries[key][1].get('company_name') or '?' for key in pair['keys']]
+        print(f"\n{' / '.join(dict.fromkeys(names))} ({', '.join(pair['reasons'])}; text {pair['similarity']:.0%})")
+        for key in pair['keys']:
+            print(f"  - {key}")
+
+if __name__ == "__main__":
+    main()
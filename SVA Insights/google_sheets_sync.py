@@ -12,6 +12,10 @@ from typing import List, Dict, Any
 import requests
 from datetime import datetime
 
+from sva_logging import configure_logging, get_logger
+
+log = get_logger('sheets_sync')
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent
 ANALYSIS_DIR = PROJECT_ROOT / "analysis"
@@ -35,7 +39,7 @@ def get_google_sheet_as_csv(sheet_url: str) -> str:
     # Convert to CSV export URL
     csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv"
     
-    print(f"Fetching data from: {csv_url}")
+    log.info("Fetching data from: %s", csv_url)
     
     try:
         response = requests.get(csv_url, timeout=30)
@@ -95,7 +99,7 @@ def get_existing_companies() -> set:
                 if company_name:
                     existing.add(normalize_company_name(company_name))
         except Exception as e:
-            print(f"Error reading {analysis_file}: {e}")
+            log.warning("Error reading %s: %s", analysis_file, e)
     
     return existing
 
@@ -123,17 +127,17 @@ def sync_with_google_sheet(sheet_url: str) -> Dict[str, Any]:
         Sync summary dictionary
     """
     try:
-        print("Starting Google Sheets sync...")
+        log.info("Starting Google Sheets sync")
         
         # Fetch CSV data
         csv_content = get_google_sheet_as_csv(sheet_url)
         submissions = parse_csv_data(csv_content)
         
-        print(f"Found {len(submissions)} submissions in spreadsheet")
+        log.info("Found %d submissions in spreadsheet", len(submissions))
         
         # Get existing companies
         existing_companies = get_existing_companies()
-        print(f"Found {len(existing_companies)} existing analysis files")
+        log.info("Found %d existing analysis files", len(existing_companies))
         
         # Find new companies
         new_companies = []
@@ -144,14 +148,14 @@ def sync_with_google_sheet(sheet_url: str) -> Dict[str, Any]:
             if normalized_name not in existing_companies:
                 new_companies.append(submission)
         
-        print(f"Found {len(new_companies)} new companies to process")
+        log.info("Found %d new companies to process", len(new_companies))
         
         # Save new submissions to a temporary file for processing
         if new_companies:
             temp_file = PROJECT_ROOT / "temp_new_submissions.json"
             with open(temp_file, 'w', encoding='utf-8') as f:
                 json.dump(new_companies, f, indent=2)
-            print(f"Saved new submissions to {temp_file}")
+            log.info("Saved new submissions to %s", temp_file)
         
         return {
             'status': 'success',
@@ -170,6 +174,7 @@ def sync_with_google_sheet(sheet_url: str) -> Dict[str, Any]:
         }
 
 if __name__ == "__main__":
+    configure_logging()
     # Test with a sample URL (replace with actual spreadsheet URL)
     test_url = "https://docs.google.com/spreadsheets/d/1example/edit"
     result = sync_with_google_sheet(test_url)
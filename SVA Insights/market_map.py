@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Market Map Matching for SemperVirens Accelerator
+Joins applicants against the Company Universe market map (the Affinity
+export in "SVA Data from Raquel/") to show whether a company is already in
+the pipeline: its thesis category, owners and status.
+
+Records are blocked by normalized website domain (exact lookup) and by
+character trigrams of the normalized name, so each applicant is compared
+only with the few records sharing a block instead of all ~1,600.
+"""
+
+import csv
+import os
+import re
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from duplicate_index import website_domain
+from sva_logging import get_logger
+
+log = get_logger(__name__)
+
+# Trigram Jaccard similarity a name-only match needs
+NAME_THRESHOLD = 0.8
+
+# Names this short or shorter match only when identical after normalization
+SHORT_NAME = 5
+
+# Trigrams in more records than this are too common to block on
+MAX_BLOCK_SIZE = 200
+
+# Trailing words that don't distinguish one company from another
+_NAME_SUFFIXES = frozenset({
+    'inc', 'incorporated', 'llc', 'ltd', 'limited', 'corp', 'corporation', 'co', 'company', 'pbc', 'gmbh',
+    'ai', 'io', 'com', 'app', 'hq', 'labs', 'technologies', 'technology',
+})
+
+# Columns of the Affinity export
+COLUMNS = {
+    'name': 'Name',
+    'website': 'Website',
+    'category': 'Thesis Category (2024)',
+    'owners': 'Owners',
+    'status': 'Status',
+    'sector': 'Core Sector',
+}
+
+
+def normalize_name(name) -> str:
+    """Lowercase letters and digits of a company name, without legal and domain suffixes"""
+    words = re.findall(r'[a-z0-9]+', (name or '').lower() if isinstance(name, str) else '')
+    while len(words) > 1 and words[-1] in _NAME_SUFFIXES:
+        words.pop()
+    return ''.join(words)
+
+
+def trigrams(normalized: str) -> frozenset:
+    padded = f'^{normalized}$'
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def owner_names(owners: str) -> List[str]:
+    """Owner names without their emails, from 'Ann Lee <ann@x.com>; Bo Kim <bo@x.com>'"""
+    return [re.sub(r'\s*<[^>]*>', '', owner).strip() for owner in (owners or '').split(';') if owner.strip()]
+
+
+class MarketMap:
+    """
+    The market map CSV, loaded on first use and reloaded when the file changes.
+
+    `version` identifies the loaded file (for ETags and render caches) and
+    `last_modified` is its mtime; a missing file is an empty map.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._stamp = None
+        self.version = 'none'
+        self.last_modified: Optional[datetime] = None
+        # (records, by domain, by normalized name, trigram blocks, trigrams per
+        # record), replaced as a whole so lookups never see a partial reload
+        self._table = ([], {}, {}, {}, [])
+
+    @property
+    def records(self) -> List[dict]:
+        self.refresh()
+        return self._table[0]
+
+    def refresh(self) -> str:
+        """Reload the file if it changed; returns the current version"""
+        try:
+            stat = os.stat(self.path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        with self._lock:
+            if stamp != self._stamp:
+                self._stamp = stamp
+                self._load(stamp)
+            return self.version
+
+    def _load(self, stamp):
+        records = []
+        if stamp is not None:
+            try:
+                with open(self.path, 'r', encoding='utf-8-sig', newline='') as f:
+                    for row in csv.DictReader(f):
+                        record = {field: (row.get(column) or '').strip() for field, column in COLUMNS.items()}
+                        if record['name']:
+                            record['owners'] = owner_names(record['owners'])
+                            records.append(record)
+            except (OSError, csv.Error) as e:
+                log.warning("Could not read market map %s: %s", self.path, e)
+        else:
+            log.info("No market map at %s", self.path)
+
+        by_domain, by_name, blocks, grams = {}, {}, {}, []
+        for i, record in enumerate(records):
+            domain = website_domain(record['website'])
+            if domain:
+                by_domain.setdefault(domain, i)
+            name = normalize_name(record['name'])
+            if name:
+                by_name.setdefault(name, i)
+            grams.append(trigrams(name) if name else frozenset())
+            for gram in grams[-1]:
+                blocks.setdefault(gram, []).append(i)
+
+        blocks = {gram: ids for gram, ids in blocks.items() if len(ids) <= MAX_BLOCK_SIZE}
+        self._table = (records, by_domain, by_name, blocks, grams)
+        self.version = f'{stamp[0]:x}-{stamp[1]:x}' if stamp else 'none'
+        self.last_modified = datetime.fromtimestamp(stamp[0] / 1e9, tz=timezone.utc) if stamp else None
+        log.debug("Market map loaded", extra={'fields': {'records': len(records), 'domains': len(by_domain)}})
+
+    def match(self, name, website) -> Optional[dict]:
+        """
+        The market map record for an applicant, or None
+
+        Returns:
+            The record's category, owners, status and sector plus `matched_on`
+            ('website' or 'name') and the name `similarity`
+        """
+        self.refresh()
+        table = self._table
+        _, by_domain, by_name, blocks, record_grams = table
+        domain = website_domain(website)
+        normalized = normalize_name(name)
+
+        if domain and domain in by_domain:
+            return self._result(table, by_domain[domain], 'website', normalized)
+        if not normalized:
+            return None
+        if normalized in by_name:
+            return self._result(table, by_name[normalized], 'name', normalized)
+        if len(normalized) <= SHORT_NAME:
+            return None
+
+        grams = trigrams(normalized)
+        shared = Counter()
+        for gram in grams:
+            shared.update(blocks.get(gram, ()))
+        # Only records sharing enough blocks can reach the threshold; common
+        # trigrams aren't blocked on, so the exact similarity decides
+        best, best_score = None, NAME_THRESHOLD
+        for i, common in shared.items():
+            if common < len(grams) * NAME_THRESHOLD / 2:
+                continue
+            score = len(grams & record_grams[i]) / len(grams | record_grams[i])
+            if score >= best_score:
+                best, best_score = i, score
+        return self._result(table, best, 'name', normalized) if best is not None else None
+
+    @staticmethod
+    def _result(table, i: int, matched_on: str, normalized: str) -> dict:
+        record, record_grams = table[0][i], table[4][i]
+        grams = trigrams(normalized) if normalized else frozenset()
+        similarity = len(grams & record_grams) / len(grams | record_grams) if grams else 0.0
+        return {
+            'name': record['name'],
+            'website': record['website'],
+            'category': record['category'],
+            'owners': record['owners'],
+            'status': record['status'],
+            'sector': record['sector'],
+            'matched_on': matched_on,
+            'similarity': round(similarity, 3),
+        }
+
+    def match_cards(self, cards: List[dict]) -> Dict[str, dict]:
+        """Match every applicant card; slug -> record for those found"""
+        matches = {}
+        for card in cards:
+            found = self.match(card.get('company_name'), card.get('website'))
+            if found is not None and card.get('slug'):
+                matches.setdefault(card['slug'], found)
+        return matches
+
+
+def card_fields(match: Optional[dict]) -> dict:
+    """The market map fields a dashboard card shows ('' when unmatched)"""
+    match = match or {}
+    return {
+        'market_category': match.get('category', ''),
+        'market_owners': ', '.join(match.get('owners', [])),
+        'market_status': match.get('status', ''),
+        'market_match': match.get('matched_on', ''),
+    }
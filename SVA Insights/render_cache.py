@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Rendered Page Cache for SemperVirens Accelerator
+Bounded LRU of rendered HTML for analysis pages, keyed by the analysis file,
+its content hash and the template version.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+
+class RenderCache:
+    """
+    Least-recently-used cache of rendered pages.
+
+    Keys start with the analysis filename so every page of an analysis can be
+    dropped at once when it is regenerated; the content hash in the key makes
+    stale hits impossible even without that.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._pages: "OrderedDict[tuple, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, filename: str, key: Hashable, render: Callable[[], str]) -> str:
+        """Return the cached page for (filename, key), rendering and storing it on a miss"""
+        cache_key = (filename, key)
+        with self._lock:
+            page = self._pages.get(cache_key)
+            if page is not None:
+                self._pages.move_to_end(cache_key)
+                self.hits += 1
+                return page
+            self.misses += 1
+
+        # Render outside the lock; two concurrent misses just render twice
+        page = render()
+        with self._lock:
+            self._pages[cache_key] = page
+            self._pages.move_to_end(cache_key)
+            while len(self._pages) > self.max_entries:
+                self._pages.popitem(last=False)
+        return page
+
+    def invalidate(self, filename: str):
+        """Drop every cached page of one analysis file"""
+        with self._lock:
+            for cache_key in [k for k in self._pages if k[0] == filename]:
+                del self._pages[cache_key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'entries': len(self._pages), 'max_entries': self.max_entries,
+                    'hits': self.hits, 'misses': self.misses}
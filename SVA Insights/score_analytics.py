@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Portfolio Score Analytics for SemperVirens Accelerator
+Cross-company statistics over the N x 6 matrix of 6T scores: per-T
+distribution (mean, spread, percentiles, histogram), cohort means, and each
+company's z-score, percentile rank and rank per T. Also ranks every company
+by a weighted mean of its 6T scores for any choice of per-T weights.
+
+Everything is computed once per card-index version, and only when a score,
+name or cohort changed (`score_rows`). NumPy is an optional speed-up that
+vectorizes the whole matrix; without it the same numbers come from plain
+Python.
+"""
+
+import bisect
+import math
+import statistics
+import warnings
+from typing import Dict, List, Optional
+
+from analysis_catalog import SIX_TS
+
+try:
+    import numpy as np
+except ImportError:  # optional; the pure-Python path gives the same results
+    np = None
+
+PERCENTILES = [10, 25, 50, 75, 90]
+
+# Histogram bins centred on the whole scores 1..5
+SCORE_LEVELS = [1, 2, 3, 4, 5]
+_BIN_EDGES = [level - 0.5 for level in SCORE_LEVELS] + [SCORE_LEVELS[-1] + 0.5]
+
+# Ranking weights run 0..MAX_WEIGHT per T; unset ones count once
+DEFAULT_WEIGHT = 1.0
+MAX_WEIGHT = 5.0
+TOP_K = 20
+
+
+def _number(value) -> Optional[float]:
+    """Round for JSON; NaN and missing values become None"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return round(float(value), 3)
+
+
+def normalize_weights(weights: Optional[Dict[str, float]]) -> Dict[str, float]:
+    """
+    Per-T weights clamped to 0..MAX_WEIGHT, with DEFAULT_WEIGHT for missing
+    or invalid ones; all zeros means equal weights
+    """
+    normalized = {}
+    for t in SIX_TS:
+        value = (weights or {}).get(t)
+        if not isinstance(value, (int, float)) or math.isnan(value):
+            value = DEFAULT_WEIGHT
+        normalized[t] = min(max(float(value), 0.0), MAX_WEIGHT)
+    if not any(normalized.values()):
+        normalized = {t: DEFAULT_WEIGHT for t in SIX_TS}
+    return normalized
+
+
+def parse_weights(value: Optional[str]) -> Dict[str, float]:
+    """Weights from a comma-separated list in SIX_TS order, e.g. 2,1,1,1.5,1,1"""
+    weights = {}
+    for t, part in zip(SIX_TS, (value or '').split(',')):
+        try:
+            weights[t] = float(part)
+        except ValueError:
+            continue
+    return normalize_weights(weights)
+
+
+def _percentile(ordered: List[float], p: float) -> float:
+    """Linear-interpolated percentile of sorted values (NumPy's default method)"""
+    k = (len(ordered) - 1) * p / 100
+    low = math.floor(k)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (k - low)
+
+
+def score_rows(cards: List[dict]) -> tuple:
+    """What the analytics are computed from: slug, name, cohort and 6T scores per card"""
+    return tuple((card.get('slug') or '', card.get('company_name') or card.get('slug') or '', card.get('cohort', 1),
+                  tuple((card.get('scores') or {}).get(t) for t in SIX_TS)) for card in cards)
+
+
+class ScoreAnalytics:
+    """
+    Statistics over the 6T scores of every card.
+
+    `sections` holds the per-T portfolio summary; `scores`, `z`, `percentile`
+    and `rank` are N x 6 (row per card, column per T, None where a score is
+    missing). Rank 1 is the highest score; ties share a rank.
+    """
+
+    def __init__(self, cards: List[dict]):
+        self.rows = score_rows(cards)
+        self.slugs = [slug for slug, _, _, _ in self.rows]
+        self.names = [name for _, name, _, _ in self.rows]
+        self.cohorts = [cohort for _, _, cohort, _ in self.rows]
+        self._rows = {slug: i for i, slug in reversed(list(enumerate(self.slugs))) if slug}
+        matrix = [list(scores) for _, _, _, scores in self.rows]
+        self.scores = matrix
+        # Missing scores count as 0 in weighted totals
+        self._filled = None
+
+        if np is not None:
+            self.backend = 'numpy'
+            self._compute_numpy(matrix)
+        else:
+            self.backend = 'python'
+            self._compute_python(matrix)
+
+    def _compute_numpy(self, matrix):
+        scores = np.array([[np.nan if v is None else v for v in row] for row in matrix], dtype=float).reshape(-1, len(SIX_TS))
+        cohorts = np.array(self.cohorts)
+        valid = ~np.isnan(scores)
+        count = valid.sum(axis=0)
+        self._filled = np.nan_to_num(scores)
+
+        # All-missing columns and cohorts just come out as NaN
+        with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mean = np.nanmean(scores, axis=0)
+            std = np.nanstd(scores, axis=0)
+            percentiles = np.nanpercentile(scores, PERCENTILES, axis=0)
+            low, high = np.nanmin(scores, axis=0), np.nanmax(scores, axis=0)
+            cohort_means = {int(c): np.nanmean(scores[cohorts == c], axis=0) for c in np.unique(cohorts)}
+            z = np.where(std > 0, (scores - mean) / std, 0.0)
+
+        # Scores below / above each one, by binary search in the sorted column
+        above = np.zeros(scores.shape, dtype=int)
+        below = np.zeros(scores.shape, dtype=int)
+        for j in range(len(SIX_TS)):
+            ordered = np.sort(scores[valid[:, j], j])
+            below[:, j] = np.searchsorted(ordered, scores[:, j], side='left')
+            above[:, j] = len(ordered) - np.searchsorted(ordered, scores[:, j], side='right')
+        with np.errstate(invalid='ignore', divide='ignore'):
+            percentile = (below + 0.5 * (count - above - below)) / count * 100
+
+        self.sections = {}
+        for j, t in enumerate(SIX_TS):
+            column = scores[valid[:, j], j]
+            histogram = np.histogram(column, bins=_BIN_EDGES)[0]
+            self.sections[t] = self._section(
+                int(count[j]), mean[j], std[j], low[j], high[j], percentiles[:, j],
+                [int(n) for n in histogram],
+                {c: means[j] for c, means in cohort_means.items() if not np.isnan(means[j])},
+            )
+
+        self.z = [[None if not valid[i, j] else _number(z[i, j]) for j in range(len(SIX_TS))] for i in range(len(scores))]
+        self.percentile = [[None if not valid[i, j] else _number(percentile[i, j]) for j in range(len(SIX_TS))] for i in range(len(scores))]
+        self.rank = [[None if not valid[i, j] else int(above[i, j]) + 1 for j in range(len(SIX_TS))] for i in range(len(scores))]
+
+    def _compute_python(self, matrix):
+        self.sections = {}
+        self.z = [[None] * len(SIX_TS) for _ in matrix]
+        self.percentile = [[None] * len(SIX_TS) for _ in matrix]
+        self.rank = [[None] * len(SIX_TS) for _ in matrix]
+
+        for j, t in enumerate(SIX_TS):
+            column = [(i, row[j]) for i, row in enumerate(matrix) if row[j] is not None]
+            values = sorted(v for _, v in column)
+            n = len(values)
+            if not n:
+                self.sections[t] = self._section(0, None, None, None, None, [None] * len(PERCENTILES),
+                                                 [0] * len(SCORE_LEVELS), {})
+                continue
+
+            mean = statistics.fmean(values)
+            std = statistics.pstdev(values)
+            histogram = [sum(1 for v in values if low <= v < high) for low, high in zip(_BIN_EDGES, _BIN_EDGES[1:])]
+            histogram[-1] += sum(1 for v in values if v == _BIN_EDGES[-1])
+            by_cohort: Dict[int, List[float]] = {}
+            for i, v in column:
+                by_cohort.setdefault(self.cohorts[i], []).append(v)
+            self.sections[t] = self._section(
+                n, mean, std, values[0], values[-1], [_percentile(values, p) for p in PERCENTILES],
+                histogram, {c: statistics.fmean(vs) for c, vs in by_cohort.items()},
+            )
+
+            for i, v in column:
+                above = n - bisect.bisect_right(values, v)
+                below = bisect.bisect_left(values, v)
+                self.z[i][j] = _number((v - mean) / std if std > 0 else 0.0)
+                self.percentile[i][j] = _number((below + 0.5 * (n - above - below)) / n * 100)
+                self.rank[i][j] = above + 1
+
+    @staticmethod
+    def _section(count, mean, std, low, high, percentiles, histogram, cohort_means) -> dict:
+        return {
+            'count': count,
+            'mean': _number(mean),
+            'std': _number(std),
+            'min': _number(low),
+            'max': _number(high),
+            'percentiles': {str(p): _number(v) for p, v in zip(PERCENTILES, percentiles)},
+            'histogram': {str(level): n for level, n in zip(SCORE_LEVELS, histogram)},
+            'cohort_means': {str(c): _number(v) for c, v in sorted(cohort_means.items())},
+        }
+
+    def summary(self) -> dict:
+        """Portfolio-wide statistics per T"""
+        return {'count': len(self.slugs), 'backend': self.backend, 'sections': self.sections}
+
+    def weighted_totals(self, weights: Optional[Dict[str, float]] = None) -> List[float]:
+        """
+        Weighted mean 6T score of every card, in card order: one
+        matrix-vector product of the score matrix with the normalized weights.
+        Rounded so float noise can't reorder ties.
+        """
+        weights = normalize_weights(weights)
+        total_weight = sum(weights.values())
+        vector = [weights[t] / total_weight for t in SIX_TS]
+        if self._filled is not None:
+            totals = (self._filled @ np.array(vector)).tolist()
+        else:
+            totals = [sum((score or 0) * w for score, w in zip(row, vector)) for row in self.scores]
+        return [round(total, 9) for total in totals]
+
+    def ranking(self, weights: Optional[Dict[str, float]] = None, top_k: int = TOP_K) -> List[dict]:
+        """
+        The top_k cards by weighted score, each with its per-T breakdown
+        (score, weight and contribution to the weighted score). Ties share
+        a rank and keep submission order.
+        """
+        weights = normalize_weights(weights)
+        total_weight = sum(weights.values())
+        totals = self.weighted_totals(weights)
+        order = sorted(range(len(totals)), key=lambda i: -totals[i])
+
+        ranked = []
+        rank = 0
+        for position, i in enumerate(order[:max(top_k, 0)]):
+            if position == 0 or totals[i] != totals[order[position - 1]]:
+                rank = position + 1
+            ranked.append({
+                'rank': rank,
+                'slug': self.slugs[i],
+                'company_name': self.names[i],
+                'score': _number(totals[i]),
+                'breakdown': {t: {'score': self.scores[i][j], 'weight': weights[t],
+                                  'contribution': _number((self.scores[i][j] or 0) * weights[t] / total_weight)}
+                              for j, t in enumerate(SIX_TS)},
+            })
+        return ranked
+
+    def company(self, slug: str) -> Optional[dict]:
+        """One company's standing per T: score, z-score, percentile rank and rank"""
+        i = self._rows.get(slug)
+        if i is None:
+            return None
+        return {t: {'score': self.scores[i][j], 'z': self.z[i][j], 'percentile': self.percentile[i][j], 'rank': self.rank[i][j],
+                    'of': self.sections[t]['count']}
+                for j, t in enumerate(SIX_TS)}
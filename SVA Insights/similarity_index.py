@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Similar-Company Finder for SemperVirens Accelerator
+TF-IDF vectors over each applicant's description, problem statement and
+named competitors, with an inverted index for nearest-neighbour lookups
+("who else in the pipeline does this").
+
+Term counts are kept per card and reused while its text is unchanged, so a
+card-index update only re-tokenizes the applicants that changed; the IDF
+weights and vector norms are then re-derived from the cached counts.
+"""
+
+import math
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from submission_index import tokenize
+
+# Fields of a card summary that describe what the company does
+TEXT_FIELDS = ['description', 'problem_statement']
+
+# A shared competitor says more than a shared word
+COMPETITOR_WEIGHT = 2.0
+
+TOP_SIMILAR = 5
+
+# Shared terms listed per match to show why it was picked
+SHARED_TERMS = 5
+
+# Competitor names become one term each, kept apart from ordinary words
+_COMPETITOR_PREFIX = '@'
+
+STOP_WORDS = frozenset('''
+a about across after all also an and any are as at be because been being both but by can could do does
+each for from has have how if in into is it its more most not of on one or other our out over so such
+than that the their them then there these they this those through to up us using via was we were what
+when where which while who will with within without would you your
+'''.split())
+
+
+def card_text(card: dict) -> Tuple[str, ...]:
+    """The parts of a card the index reads, used to spot unchanged cards"""
+    return tuple(card.get(field) or '' for field in TEXT_FIELDS) + tuple(card.get('competitors') or [])
+
+
+def term_counts(card: dict) -> Counter:
+    """Word counts of the text fields plus one weighted term per competitor"""
+    counts = Counter()
+    for field in TEXT_FIELDS:
+        counts.update(word for word in tokenize(card.get(field))
+                      if word not in STOP_WORDS and len(word) > 1 and not word.isdigit())
+    for name in card.get('competitors') or []:
+        term = _COMPETITOR_PREFIX + ' '.join(tokenize(name))
+        if len(term) > 1:
+            counts[term] = COMPETITOR_WEIGHT
+    return counts
+
+
+class SimilarityIndex:
+    """
+    Sparse TF-IDF matrix over the cards, one row per applicant.
+
+    Rows are L2-normalized dicts of term -> weight (sublinear TF, smoothed
+    IDF), and `postings` maps each term to the (row, weight) pairs holding
+    it, so a lookup only touches applicants sharing at least one term.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Tuple[Tuple[str, ...], Counter]] = {}
+        self.cards: List[dict] = []
+        self.vectors: List[Dict[str, float]] = []
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        self._rows: Dict[str, int] = {}
+
+    def update(self, cards: List[dict]) -> int:
+        """
+        Rebuild the matrix for a new card list, re-tokenizing only cards
+        whose text changed
+
+        Returns:
+            Number of cards that were (re)tokenized
+        """
+        with self._lock:
+            previous = self._counts
+            counts = {}
+            tokenized = 0
+            keys = []
+            for i, card in enumerate(cards):
+                key = card.get('slug') or ''
+                if not key or key in counts:
+                    key = f'{key}#{i}'
+                keys.append(key)
+                text = card_text(card)
+                cached = previous.get(key)
+                if cached is None or cached[0] != text:
+                    cached = (text, term_counts(card))
+                    tokenized += 1
+                counts[key] = cached
+
+            document_frequency = Counter()
+            for _, terms in counts.values():
+                document_frequency.update(terms.keys())
+            n = len(cards)
+            idf = {term: math.log((1 + n) / (1 + df)) + 1 for term, df in document_frequency.items()}
+
+            vectors = []
+            postings: Dict[str, List[Tuple[int, float]]] = {}
+            rows = {}
+            for i, (card, key) in enumerate(zip(cards, keys)):
+                weights = {term: (1 + math.log(tf)) * idf[term] for term, tf in counts[key][1].items()}
+                norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+                vector = {term: w / norm for term, w in weights.items()}
+                vectors.append(vector)
+                for term, w in vector.items():
+                    postings.setdefault(term, []).append((i, w))
+                if card.get('slug'):
+                    rows.setdefault(card['slug'], i)
+
+            self._counts = counts
+            self.cards = cards
+            self.vectors = vectors
+            self.postings = postings
+            self._rows = rows
+            return tokenized
+
+    def similar(self, slug: str, limit: int = TOP_SIMILAR) -> Optional[List[dict]]:
+        """
+        The applicants closest to one by cosine similarity, best first
+
+        Returns:
+            None if the slug is unknown, otherwise up to `limit` dicts with
+            the matched card, its `similarity` (0..1) and the `shared` terms
+            that contributed most
+        """
+        with self._lock:
+            row = self._rows.get(slug)
+            if row is None:
+                return None
+            cards, vectors, postings = self.cards, self.vectors, self.postings
+
+        scores: Dict[int, float] = {}
+        for term, weight in vectors[row].items():
+            for other, other_weight in postings[term]:
+                if other != row:
+                    scores[other] = scores.get(other, 0.0) + weight * other_weight
+
+        matches = []
+        for other, score in sorted(scores.items(), key=lambda item: -item[1])[:max(limit, 0)]:
+            shared = sorted(vectors[row].keys() & vectors[other].keys(),
+                            key=lambda term: -vectors[row][term] * vectors[other][term])[:SHARED_TERMS]
+            matches.append({
+                'card': cards[other],
+                'similarity': round(score, 3),
+                'shared': [term.lstrip(_COMPETITOR_PREFIX) for term in shared],
+            })
+        return matches
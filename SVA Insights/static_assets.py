@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Static Assets for SemperVirens Accelerator
+Serves static/ from memory with a content hash per file and compressed
+variants built once per file version. URLs from url_for('static', ...) carry
+?v=<hash>, so browsers can cache them as immutable and a changed file gets a
+new URL.
+"""
+
+import hashlib
+import mimetypes
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from werkzeug.security import safe_join
+
+from compression import COMPRESSIBLE_TYPES, ENCODINGS, MIN_SIZE, compress, negotiate
+
+# A year: the longest max-age caches honour
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+
+class StaticAsset:
+    """One static file: its bytes, content hash and compressed variants"""
+
+    __slots__ = ('path', 'mtime_ns', 'size', 'digest', 'mimetype', 'variants')
+
+    def __init__(self, path: str, mtime_ns: int, size: int, data: bytes):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = hashlib.sha1(data).hexdigest()[:12]
+        self.mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        self.variants: Dict[Optional[str], bytes] = {None: data}
+        if self.mimetype in COMPRESSIBLE_TYPES and len(data) >= MIN_SIZE:
+            for encoding in ENCODINGS:
+                compressed = compress(data, encoding, best=True)
+                if len(compressed) < len(data):
+                    self.variants[encoding] = compressed
+
+    @property
+    def compressible(self) -> bool:
+        return len(self.variants) > 1
+
+    def body(self, accept_encodings):
+        """(encoding or None, bytes) of the best variant the client accepts"""
+        encoding = negotiate(accept_encodings, [e for e in self.variants if e])
+        return encoding, self.variants[encoding]
+
+
+class StaticAssets:
+    """
+    In-memory cache of the files under a static directory.
+
+    Each lookup stats the file and reloads it only if its mtime or size
+    changed, so edited assets get a new hash without a restart.
+    """
+
+    def __init__(self, root: Path):
+        self.root = str(root)
+        self._assets: Dict[str, StaticAsset] = {}
+        self._lock = threading.Lock()
+
+    def get(self, filename: str) -> Optional[StaticAsset]:
+        """The asset for a path relative to the static directory, or None"""
+        path = safe_join(self.root, filename)
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if not os.path.isfile(path):
+            return None
+
+        with self._lock:
+            asset = self._assets.get(path)
+            if asset is not None and asset.mtime_ns == stat.st_mtime_ns and asset.size == stat.st_size:
+                return asset
+
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        asset = StaticAsset(path, stat.st_mtime_ns, stat.st_size, data)
+        with self._lock:
+            self._assets[path] = asset
+        return asset
+
+    def fingerprint(self, filename: str) -> Optional[str]:
+        """Content hash for a static URL, or None if the file doesn't exist"""
+        asset = self.get(filename)
+        return asset.digest if asset is not None else None
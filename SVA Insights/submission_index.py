@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Submission Search Index for SemperVirens Accelerator
+In-memory inverted index and facet bitsets over the index-page card
+summaries, answering the dashboard's search, cohort/status/score filters,
+facet counts, sorting and pagination.
+"""
+
+import bisect
+import math
+import re
+from typing import Dict, List, Optional
+
+from analysis_catalog import SIX_TS
+
+# Card fields covered by search
+SEARCH_FIELDS = ['company_name', 'description', 'founder', 'website']
+
+# 'weighted' orders by the weighted 6T score passed to search()
+SORT_OPTIONS = ['submitted', '-submitted', 'name', 'status', 'weighted']
+
+# Score thresholds a 6T filter can ask for ("team >= 4")
+SCORE_LEVELS = [1, 2, 3, 4, 5]
+
+PER_PAGE = 20
+
+# Fields a dashboard card displays, in the column order of compact_rows()
+CARD_FIELDS = ['company_name', 'slug', 'submitted_at', 'description', 'website', 'year_founded', 'founder', 'status',
+               'weighted_score', 'market_category', 'market_owners', 'market_status', 'market_match']
+
+# Cards clamp the description to three lines; a little over that is plenty
+DESCRIPTION_PREVIEW = 320
+
+# int.bit_count() is Python 3.10+
+_popcount = int.bit_count if hasattr(int, 'bit_count') else (lambda bits: bin(bits).count('1'))
+
+
+def tokenize(text: str) -> List[str]:
+    return re.findall(r'[a-z0-9]+', (text or '').lower())
+
+
+def compact_rows(cards: List[dict]) -> List[list]:
+    """Cards as rows of CARD_FIELDS values ('' for missing ones), with descriptions cut to a preview"""
+    rows = []
+    for card in cards:
+        row = [card.get(field) for field in CARD_FIELDS]
+        row = ['' if value is None else value for value in row]
+        description = row[3]
+        if len(description) > DESCRIPTION_PREVIEW:
+            row[3] = description[:DESCRIPTION_PREVIEW].rsplit(' ', 1)[0] + '...'
+        rows.append(row)
+    return rows
+
+
+def _ids(bits: int) -> List[int]:
+    """Positions of the set bits, lowest first"""
+    ids = []
+    while bits:
+        low = bits & -bits
+        ids.append(low.bit_length() - 1)
+        bits ^= low
+    return ids
+
+
+class SubmissionIndex:
+    """
+    Search and facet structure built once per card-index version.
+
+    Every card gets a document id, and each set of cards is an int bitset
+    with bit i set for card i: `postings` per search token (query terms
+    match by prefix through a sorted vocabulary), and facet bitsets per
+    cohort, per recommendation status and, for each of the 6Ts, per
+    "score >= level" threshold. Any filter combination is a chain of ANDs.
+    """
+
+    def __init__(self, cards: List[dict]):
+        """cards: CardIndex.cards(), in submission order and tagged with their cohort"""
+        self.cards = []
+        self.postings: Dict[str, int] = {}
+        self.by_cohort: Dict[int, int] = {}
+        self.by_status: Dict[str, int] = {}
+        self.score_at_least: Dict[str, Dict[int, int]] = {t: {level: 0 for level in SCORE_LEVELS} for t in SIX_TS}
+
+        for doc_id, card in enumerate(cards):
+            bit = 1 << doc_id
+            cohort = card.get('cohort', 1)
+            submitted_ts = card.get('submitted_ts')
+            self.cards.append({**card, '_submitted': submitted_ts if submitted_ts is not None else math.inf})
+
+            for field in SEARCH_FIELDS:
+                for token in tokenize(card.get(field)):
+                    self.postings[token] = self.postings.get(token, 0) | bit
+            self.by_cohort[cohort] = self.by_cohort.get(cohort, 0) | bit
+            status = card.get('status') or ''
+            self.by_status[status] = self.by_status.get(status, 0) | bit
+
+            for t, score in (card.get('scores') or {}).items():
+                if t not in self.score_at_least or score is None:
+                    continue
+                for level in SCORE_LEVELS:
+                    if score >= level:
+                        self.score_at_least[t][level] |= bit
+
+        self.vocabulary = sorted(self.postings)
+        self.all_ids = (1 << len(self.cards)) - 1
+
+    @property
+    def cohorts(self) -> List[int]:
+        return sorted(self.by_cohort)
+
+    def cohort_size(self, cohort: int) -> int:
+        return _popcount(self.by_cohort.get(cohort, 0))
+
+    def _match_term(self, term: str) -> int:
+        """Cards containing a word that starts with term"""
+        matched = 0
+        start = bisect.bisect_left(self.vocabulary, term)
+        for word in self.vocabulary[start:]:
+            if not word.startswith(term):
+                break
+            matched |= self.postings[word]
+        return matched
+
+    def match(self, q: str = '') -> int:
+        """Cards matching every term of a free-text query (all cards for an empty query)"""
+        bits = self.all_ids
+        for term in tokenize(q):
+            bits &= self._match_term(term)
+            if not bits:
+                break
+        return bits
+
+    def _result(self, doc_id: int, weighted: Optional[List[float]]) -> dict:
+        card = {k: v for k, v in self.cards[doc_id].items() if not k.startswith('_')}
+        if weighted is not None:
+            card['weighted_score'] = round(weighted[doc_id], 2)
+        return card
+
+    def search(self, q: str = '', cohort: Optional[int] = None, status: Optional[str] = None,
+               min_scores: Optional[Dict[str, int]] = None, sort: str = 'submitted',
+               page: int = 1, per_page: int = PER_PAGE, weighted: Optional[List[float]] = None) -> dict:
+        """
+        Filter, sort and paginate the cards
+
+        Args:
+            min_scores: 6T name to minimum score, e.g. {'team': 4, 'traction': 3}
+            weighted: weighted 6T score per card, in card order, for the
+                'weighted' sort (ScoreAnalytics.weighted_totals)
+
+        Returns:
+            Dict with the page of results, totals and facet counts. Each
+            facet is counted under every active filter except its own, so
+            the counts say how many results picking that value would give.
+        """
+        min_scores = {t: level for t, level in (min_scores or {}).items()
+                      if t in self.score_at_least and level in SCORE_LEVELS}
+
+        filters = {'q': self.match(q)}
+        if cohort is not None:
+            filters['cohort'] = self.by_cohort.get(cohort, 0)
+        if status:
+            filters['status'] = self.by_status.get(status, 0)
+        for t, level in min_scores.items():
+            filters[t] = self.score_at_least[t][level]
+
+        def combined(exclude=None) -> int:
+            bits = self.all_ids
+            for name, facet_bits in filters.items():
+                if name != exclude:
+                    bits &= facet_bits
+            return bits
+
+        selected = combined()
+        without_cohort = combined('cohort')
+        without_status = combined('status')
+        cohort_counts = {c: _popcount(without_cohort & bits) for c, bits in sorted(self.by_cohort.items())}
+        status_counts = {s: _popcount(without_status & bits) for s, bits in sorted(self.by_status.items()) if s}
+        score_counts = {}
+        for t in SIX_TS:
+            without_t = combined(t)
+            score_counts[t] = {level: _popcount(without_t & bits) for level, bits in self.score_at_least[t].items()}
+
+        if weighted is not None and len(weighted) != len(self.cards):
+            weighted = None
+
+        # Document ids follow submission order, so the default sort is free
+        ids = _ids(selected)
+        if sort == 'name':
+            ids.sort(key=lambda i: (self.cards[i]['company_name'] or '').lower())
+        elif sort == 'status':
+            ids.sort(key=lambda i: (self.cards[i]['status'] or '', self.cards[i]['_submitted']))
+        elif sort == '-submitted':
+            ids.sort(key=lambda i: self.cards[i]['_submitted'], reverse=True)
+        elif sort == 'weighted' and weighted is not None:
+            ids.sort(key=lambda i: -weighted[i])
+
+        pages = max(1, math.ceil(len(ids) / per_page))
+        page = min(max(page, 1), pages)
+        start = (page - 1) * per_page
+        return {
+            'total': len(ids),
+            'page': page,
+            'pages': pages,
+            'per_page': per_page,
+            'cohort_counts': cohort_counts,
+            'status_counts': status_counts,
+            'score_counts': score_counts,
+            'results': [self._result(i, weighted) for i in ids[start:start + per_page]],
+        }
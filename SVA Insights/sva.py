@@ -1,15 +1,13 @@
 
 # SemperVirens Accelerator Application Analysis Script (MVP)
 
-print("Starting sva.py import...")
-
 import csv
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 import json
 from openai import OpenAI
-from flask import Flask, render_template, jsonify, request, redirect, url_for, session, flash
+from flask import Flask, render_template, jsonify, request, redirect, url_for, session, flash, make_response, stream_with_context, abort
 import argparse
 from functools import wraps
 from datetime import datetime
@@ -17,40 +15,83 @@ from dotenv import load_dotenv
 import requests
 import io
 import re
+import hashlib
+from analysis_catalog import (AnalysisCatalog, CardIndex, company_slug, cohort_description, parse_cohort_cutoffs,
+                              COMPREHENSIVE_SUFFIX, SIX_TS)
+from analysis_store import AnalysisStore, EXPORT_COLUMNS
+from analysis_compare import MAX_COMPANIES, SECTION_LABELS, build_comparison
+from analysis_schema import normalize_analysis
+from analysis_model import to_model
+from analysis_snapshot import AnalysisSnapshot
+from market_map import MarketMap, card_fields
+from duplicate_index import DuplicateIndex, screen_submissions
+from similarity_index import SimilarityIndex, TOP_SIMILAR
+from score_analytics import ScoreAnalytics, DEFAULT_WEIGHT, MAX_WEIGHT, TOP_K, normalize_weights, parse_weights, score_rows
+from render_cache import RenderCache
+from compression import compress_response, etag_variants
+from static_assets import IMMUTABLE_MAX_AGE, StaticAssets
+from submission_index import SubmissionIndex, CARD_FIELDS, SCORE_LEVELS, SORT_OPTIONS, compact_rows
+from sva_logging import configure_logging, get_logger
 
-print("Loading environment variables...")
 load_dotenv()
-print("Environment variables loaded")
+# After load_dotenv() so SVA_LOG_* settings in .env apply
+configure_logging()
+log = get_logger('app')
+log.debug("Environment variables loaded")
 
 # Project structure constants
 PROJECT_ROOT = Path(__file__).parent
 DATA_DIR = PROJECT_ROOT / "data"
 TEMPLATE_DIR = PROJECT_ROOT / "templates"
+# Written by build_css.py; names the fingerprinted stylesheet bundle
+CSS_MANIFEST_PATH = PROJECT_ROOT / "static" / "css" / "manifest.json"
 OUTPUT_DIR = PROJECT_ROOT / "outputs"
 ANALYSIS_DIR = PROJECT_ROOT / "analysis"
 
 # File paths
 CSV_PATH = DATA_DIR / "SemperVirens Accelerator Applications - SemperVirens Accelerator Application Form.csv"
 TEMPLATE_PATH = TEMPLATE_DIR / "memo_template.md"
+STORE_PATH = PROJECT_ROOT / "data_lake" / "analyses.db"
+# Affinity export of the Company Universe market map; SVA_MARKET_MAP points at a newer one
+MARKET_MAP_PATH = Path(os.getenv('SVA_MARKET_MAP') or
+                       PROJECT_ROOT / "SVA Data from Raquel" / "Company_Universe_Market_Map_2024__export_Jun-06-2025 3.csv")
+
+# In-memory view of the analysis corpus, reloaded per file on mtime/size change,
+# normalized and converted to the typed model (analysis_model) once per load.
+# The packed snapshot (`python analysis_snapshot.py build`, run by the Vercel build)
+# serves every file it still matches; see analysis_snapshot for how deploys trust it
+snapshot = AnalysisSnapshot(ANALYSIS_DIR / "corpus.snapshot")
+catalog = AnalysisCatalog(ANALYSIS_DIR, transform=to_model, snapshot=snapshot)
+# Compact card summaries the index page renders from, bucketed into cohorts by
+# submission date; SVA_COHORT_CUTOFFS lists each new cohort's start date
+card_index = CardIndex(ANALYSIS_DIR, ANALYSIS_DIR / "card_index.json", snapshot=snapshot,
+                       cohort_cutoffs=parse_cohort_cutoffs(os.getenv('SVA_COHORT_CUTOFFS')))
+# Legacy analyses, summarized the same way so duplicates of them can be found
+legacy_card_index = CardIndex(ANALYSIS_DIR / "legacy", ANALYSIS_DIR / "legacy" / "card_index.json", suffix='_analysis.json')
+# Pipeline records applicants are matched against (category, owners, status)
+market_map = MarketMap(MARKET_MAP_PATH)
+# SQLite store of every analysis, imported from analysis/ on first use if missing
+store = AnalysisStore(STORE_PATH)
+# Rendered detail pages and section partials, keyed by analysis content hash
+render_cache = RenderCache()
+# static/ served from memory with content-hash URLs and precompressed variants
+static_assets = StaticAssets(PROJECT_ROOT / "static")
 
 # Initialize Flask
-print("Initializing Flask app...")
-app = Flask(__name__)
-print("Flask app initialized")
+app = Flask(__name__, static_folder=None)  # see static_file()
+log.debug("Flask app initialized")
 
 # Initialize OpenAI client with error handling
-print("Checking OpenAI API key...")
 openai_api_key = os.getenv('OPENAI_API_KEY')
 if not openai_api_key:
-    print("WARNING: OPENAI_API_KEY environment variable not set")
+    log.warning("OPENAI_API_KEY environment variable not set")
     client = None
 else:
     try:
-        print("Initializing OpenAI client...")
         client = OpenAI(api_key=openai_api_key)
-        print("OpenAI client initialized successfully")
+        log.debug("OpenAI client initialized")
     except Exception as e:
-        print(f"ERROR: Failed to initialize OpenAI client: {e}")
+        log.error("Failed to initialize OpenAI client: %s", e)
         client = None
 
 
@@ -102,15 +143,31 @@ def setup_directories():
         for directory in [DATA_DIR, TEMPLATE_DIR, OUTPUT_DIR, ANALYSIS_DIR]:
             directory.mkdir(exist_ok=True)
     except Exception as e:
-        print(f"Warning: Could not create directories: {e}")
+        log.warning("Could not create directories: %s", e)
         # In serverless environments, we might not be able to create directories
 
 # Ensure directories exist (with error handling for serverless)
 try:
     setup_directories()
-    print("Directories setup completed")
+    log.debug("Directories setup completed")
 except Exception as e:
-    print(f"Warning: Directory setup failed: {e}")
+    log.warning("Directory setup failed: %s", e)
+
+def save_analysis(analysis_file, analysis):
+    """Write an analysis to disk in canonical form and refresh its card summary"""
+    analysis = normalize_analysis(analysis)
+    with open(analysis_file, 'w', encoding='utf-8') as f:
+        json.dump(analysis, f, indent=2)
+    card_index.update(analysis_file, analysis)
+    render_cache.invalidate(analysis_file.name)
+
+    # A store created here imports the file just written; upserting it again is harmless
+    if store.ensure():
+        source = 'comprehensive' if analysis_file.name.endswith(COMPREHENSIVE_SUFFIX) else 'legacy'
+        try:
+            store.upsert(analysis_file.name, analysis, source)
+        except Exception as e:
+            log.warning("Could not update analysis store: %s", e)
 
 def analyze_submission(submission_data):
     """Process submission through OpenAI API to generate structured analysis"""
@@ -260,12 +317,10 @@ def analyze_submission(submission_data):
         return analysis
         
     except json.JSONDecodeError as e:
-        print(f"Failed to parse JSON response: {e}")
-        print("Response content:", response.choices[0].message.content)
+        log.error("Failed to parse JSON response: %s\nResponse content: %s", e, response.choices[0].message.content)
         raise
     except (KeyError, ValueError) as e:
-        print(f"Invalid response structure or content: {e}")
-        print("Response content:", response.choices[0].message.content)
+        log.error("Invalid response structure or content: %s\nResponse content: %s", e, response.choices[0].message.content)
         raise
 
 def analyze_submission_6ts(submission_data):
@@ -488,17 +543,15 @@ def analyze_submission_6ts(submission_data):
         return analysis
 
     except json.JSONDecodeError as e:
-        print(f"Failed to parse JSON response: {e}")
-        print("Response content:", response.choices[0].message.content)
+        log.error("Failed to parse JSON response: %s\nResponse content: %s", e, response.choices[0].message.content)
         raise
     except (KeyError, ValueError) as e:
-        print(f"Invalid response structure: {e}")
-        print("Response content:", response.choices[0].message.content)
+        log.error("Invalid response structure: %s\nResponse content: %s", e, response.choices[0].message.content)
         raise
 
 def process_submissions():
     """Process only the first submission and store analysis"""
-    print("Starting submission processing...")
+    log.info("Starting submission processing")
     setup_directories()
     
     with open(CSV_PATH, newline='', encoding='utf-8') as csvfile:
@@ -509,13 +562,13 @@ def process_submissions():
         try:
             row = next(reader)  # Get first row
             company_name = row['Company Name']
-            print(f"Processing submission for {company_name}...")
+            log.info("Processing submission for %s", company_name)
             
             analysis_file = ANALYSIS_DIR / f"{company_name.replace(' ', '_').lower()}_analysis.json"
             
             # Skip if already processed
             if analysis_file.exists():
-                print(f"Analysis already exists for {company_name}, skipping...")
+                log.info("Analysis already exists for %s, skipping", company_name)
                 return submissions
             
             # Get OpenAI analysis
@@ -548,18 +601,17 @@ def process_submissions():
             }
             
             # Save to file
-            with open(analysis_file, 'w', encoding='utf-8') as f:
-                json.dump(submission_data, f, indent=2)
+            save_analysis(analysis_file, submission_data)
             
             submissions.append(submission_data)
-            print(f"Successfully processed {company_name}")
+            log.info("Successfully processed %s", company_name)
             
         except StopIteration:
-            print("No submissions found in CSV file")
+            log.warning("No submissions found in CSV file")
         except Exception as e:
-            print(f"Error processing {row.get('Company Name', 'Unknown')}: {e}")
+            log.exception("Error processing %s: %s", row.get('Company Name', 'Unknown'), e)
     
-    print("Finished processing submissions")
+    log.info("Finished processing submissions")
     return submissions
 
 # Debug route (no login required)
@@ -586,6 +638,52 @@ def debug_info():
             'error': str(e)
         }), 500
 
+@app.route('/static/<path:filename>', endpoint='static')
+def static_file(filename):
+    """
+    Serve a static file from memory, precompressed when the client accepts it
+
+    Requests for the current fingerprint (?v=<hash>, added by url_for) are
+    cacheable for a year; anything else revalidates against the hash ETag.
+    """
+    asset = static_assets.get(filename)
+    if asset is None:
+        abort(404)
+
+    encoding, body = asset.body(request.accept_encodings)
+    etag = f"{asset.digest}-{encoding}" if encoding else asset.digest
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype=asset.mimetype)
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+    response.set_etag(etag)
+    response.last_modified = datetime.fromtimestamp(asset.mtime_ns / 1e9, tz=timezone.utc)
+    if asset.compressible:
+        response.vary.add('Accept-Encoding')
+
+    response.cache_control.public = True
+    if request.args.get('v') == asset.digest:
+        response.cache_control.max_age = IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    return response
+
+@app.url_defaults
+def fingerprint_static_urls(endpoint, values):
+    """Add the content hash to every url_for('static', ...) so the URL changes with the file"""
+    if endpoint == 'static' and 'v' not in values:
+        digest = static_assets.fingerprint(values.get('filename', ''))
+        if digest:
+            values['v'] = digest
+
+@app.after_request
+def compress(response):
+    """gzip/brotli text responses the client accepts compressed (see compression)"""
+    return compress_response(response, request.accept_encodings)
+
 # Health check route (no login required)
 @app.route('/health')
 def health_check():
@@ -600,6 +698,7 @@ def health_check():
             'csv_file_exists': CSV_PATH.exists() if CSV_PATH else False,
             'current_directory': str(Path.cwd()),
             'project_root': str(PROJECT_ROOT),
+            'render_cache': render_cache.stats(),
             'environment': 'vercel' if os.getenv('VERCEL') else 'local'
         })
     except Exception as e:
@@ -623,324 +722,467 @@ def auth_status():
             'error': str(e)
         }), 500
 
+_template_stamp = {'key': None, 'version': '', 'last_modified': None}
+
+def template_version():
+    """
+    Short hash of the template files' and stylesheet manifest's mtimes and
+    sizes; part of every page ETag
+    """
+    paths = sorted(TEMPLATE_DIR.rglob('*.html'))
+    if CSS_MANIFEST_PATH.exists():
+        paths.append(CSS_MANIFEST_PATH)
+    key = tuple(
+        (str(path), path.stat().st_mtime_ns, path.stat().st_size)
+        for path in paths
+    )
+    if key != _template_stamp['key']:
+        _template_stamp['key'] = key
+        _template_stamp['version'] = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:12]
+        newest_ns = max((mtime_ns for _, mtime_ns, _ in key), default=0)
+        _template_stamp['last_modified'] = datetime.fromtimestamp(newest_ns / 1e9, tz=timezone.utc)
+    return _template_stamp['version']
+
+def template_last_modified():
+    """Newest mtime among the files template_version() covers"""
+    template_version()
+    return _template_stamp['last_modified']
+
+def newest(*times):
+    """The latest of several Last-Modified times, ignoring unknown (None) ones"""
+    known = [t for t in times if t is not None]
+    return max(known) if known else None
+
+_css_manifest = {'key': None, 'bundle': None}
+
+def css_bundle():
+    """Filename of the built stylesheet (see build_css.py), or None if it hasn't been built"""
+    try:
+        stat = os.stat(CSS_MANIFEST_PATH)
+    except OSError:
+        return None
+    key = (stat.st_mtime_ns, stat.st_size)
+    if key != _css_manifest['key']:
+        try:
+            with open(CSS_MANIFEST_PATH, 'r', encoding='utf-8') as f:
+                bundle = json.load(f).get('app.css')
+        except (OSError, ValueError, AttributeError) as e:
+            log.warning("Ignoring stylesheet manifest %s: %s", CSS_MANIFEST_PATH, e)
+            bundle = None
+        _css_manifest['key'] = key
+        _css_manifest['bundle'] = bundle
+    return _css_manifest['bundle']
+
+@app.context_processor
+def stylesheet_context():
+    """
+    `css_bundle`: URL of the prebuilt stylesheet. Without one, local pages
+    compile Tailwind in the browser (`tailwind_cdn`); deployments build the
+    bundle in the Vercel build step and never load the CDN compiler.
+    """
+    bundle = css_bundle()
+    return {'css_bundle': url_for('static', filename=f'css/{bundle}') if bundle else None,
+            'tailwind_cdn': bundle is None and not os.getenv('VERCEL')}
+
+def conditional_response(etag, last_modified, build):
+    """
+    Return 304 if the client's cached copy matches, otherwise build() the response.
+
+    Either way the response carries the validators and is marked for
+    revalidation, so browsers always ask but rarely download. last_modified
+    must cover every input the etag does (see newest()), since clients that
+    send only If-Modified-Since are answered from it alone.
+    """
+    if request.if_none_match:
+        # The client may hold the compressed variant's tag (see compression)
+        matched = [tag for tag in etag_variants(etag, request.accept_encodings) if request.if_none_match.contains(tag)]
+        not_modified = bool(matched)
+        if matched:
+            etag = matched[-1]
+    else:
+        not_modified = (last_modified is not None and request.if_modified_since is not None
+                        and last_modified.replace(microsecond=0) <= request.if_modified_since)
+
+    response = app.response_class(status=304) if not_modified else make_response(build())
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+# Template output pieces per streamed chunk: large enough that the <head> and
+# page header go out in the first chunk without one tiny chunk per tag
+STREAM_BUFFER = 64
+
+def stream_page(template_name, **context):
+    """
+    Render a template as a chunked response body, flushing as it renders
+
+    The browser can start fetching stylesheets and scripts from the <head>
+    while the rest of the page is still being templated.
+    """
+    app.update_template_context(context)
+    stream = app.jinja_env.get_template(template_name).stream(context)
+    stream.enable_buffering(STREAM_BUFFER)
+    return app.response_class(stream_with_context(stream), mimetype='text/html')
+
+def compact_json(payload):
+    """JSON response without whitespace"""
+    body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return app.response_class(body, mimetype='application/json')
+
+_submission_index = {'etag': None, 'index': None}
+
+def get_submission_index():
+    """Search index over the card summaries, rebuilt whenever the card index changes"""
+    card_index.cards()
+    if _submission_index['etag'] != card_index.etag:
+        _submission_index['index'] = SubmissionIndex(card_index.cards())
+        _submission_index['etag'] = card_index.etag
+    return _submission_index['index']
+
+_similarity = {'etag': None, 'index': SimilarityIndex()}
+
+def get_similarity_index():
+    """TF-IDF index over the cards, updated (changed cards only) when the card index changes"""
+    card_index.cards()
+    if _similarity['etag'] != card_index.etag:
+        etag = card_index.etag
+        tokenized = _similarity['index'].update(card_index.cards())
+        _similarity['etag'] = etag
+        log.debug("Similarity index updated", extra={'fields': {'tokenized': tokenized}})
+    return _similarity['index']
+
+_market_matches = {'etag': None, 'matches': {}}
+
+def get_market_matches():
+    """Market map record per card slug, re-joined when the cards or the market map change"""
+    card_index.cards()
+    etag = f"{card_index.etag}-{market_map.refresh()}"
+    if _market_matches['etag'] != etag:
+        _market_matches['matches'] = market_map.match_cards(card_index.cards())
+        _market_matches['etag'] = etag
+    return _market_matches['matches']
+
+_duplicates = {'etag': None, 'index': DuplicateIndex()}
+
+def get_duplicate_index():
+    """MinHash/LSH index over current and legacy analyses, updated when either card index changes"""
+    cards = [(f"analysis/{card['file']}", card) for card in card_index.cards()]
+    cards += [(f"analysis/legacy/{card['file']}", card) for card in legacy_card_index.cards()]
+    etag = f"{card_index.etag}-{legacy_card_index.etag}"
+    if _duplicates['etag'] != etag:
+        computed = _duplicates['index'].update(cards)
+        _duplicates['etag'] = etag
+        log.debug("Duplicate index updated", extra={'fields': {'fingerprinted': computed}})
+    return _duplicates['index']
+
+_score_analytics = {'etag': None, 'analytics': None}
+
+def get_score_analytics():
+    """
+    6T score statistics over every card, recomputed only when the card index
+    changes in a way that touches the scores
+    """
+    cards = card_index.cards()
+    if _score_analytics['etag'] != card_index.etag:
+        analytics = _score_analytics['analytics']
+        if analytics is None or analytics.rows != score_rows(cards):
+            _score_analytics['analytics'] = ScoreAnalytics(cards)
+        _score_analytics['etag'] = card_index.etag
+    return _score_analytics['analytics']
+
+def submission_query():
+    """
+    Search, filter, sort and page parameters of /api/submissions;
+    6T minimums are passed by name, e.g. ?team=4&traction=3 (the 'weighted'
+    sort takes its weights separately, see api_submissions)
+    """
+    sort = request.args.get('sort', 'submitted')
+    return {
+        'q': request.args.get('q', '').strip(),
+        'cohort': request.args.get('cohort', type=int),
+        'status': request.args.get('status', '').strip() or None,
+        'min_scores': {t: request.args.get(t, type=int) for t in SIX_TS if request.args.get(t, type=int)},
+        'sort': sort if sort in SORT_OPTIONS else 'submitted',
+        'page': request.args.get('page', 1, type=int),
+    }
+
 # Flask routes
 @app.route('/')
 @login_required
 def index():
-    """Display list of all submissions"""
+    """
+    Dashboard shell; the cards, tabs and facet counts are fetched from
+    /api/submissions, so the page itself only changes with the templates
+    """
     try:
-        submissions = []
-        print("\n=== Loading Submissions ===")
-        print(f"Looking in: {ANALYSIS_DIR}")
-
-        # Ensure analysis directory exists
-        if not ANALYSIS_DIR.exists():
-            print(f"Analysis directory does not exist: {ANALYSIS_DIR}")
-            return render_template('index.html', submissions=[])
-
-        for file in ANALYSIS_DIR.glob('*_comprehensive_analysis.json'):
-            print(f"\nProcessing file: {file}")
-            try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        original_name = data.get('company_name', '')
-                        data['url_company_name'] = original_name.replace(' ', '').replace('-', '').replace('_', '').lower()
-                        print(f"Company name processing:")
-                        print(f"  Original: '{original_name}'")
-                        print(f"  URL-safe: '{data['url_company_name']}'")
-                    submissions.append(data)
-            except Exception as e:
-                print(f"Error processing file {file}: {e}")
-                continue
-
-        print(f"\nTotal submissions: {len(submissions)}")
-        print("=== End Loading ===\n")
-        return render_template('index.html', submissions=submissions)
+        return conditional_response(
+            f"shell-{template_version()}", None,
+            lambda: stream_page('index.html',
+                                max_compare=MAX_COMPANIES,
+                                sort_options=SORT_OPTIONS,
+                                six_ts=SIX_TS,
+                                score_levels=SCORE_LEVELS,
+                                section_labels=SECTION_LABELS,
+                                default_weight=DEFAULT_WEIGHT,
+                                max_weight=MAX_WEIGHT)
+        )
     except Exception as e:
-        print(f"Error in index route: {e}")
+        log.exception("Error in index route: %s", e)
         return render_template('error.html',
                               company_name="Unknown",
                               error_message=f"Error loading submissions: {str(e)}",
                               tried_filenames=[],
                               available_files=[]), 500
 
+@app.route('/api/submissions')
+@login_required
+def api_submissions():
+    """
+    Search, filter, sort and paginate the submission cards as compact JSON
+
+    Cards are rows of `fields` values; cohorts carry their description, size
+    and count under the other filters. sort=weighted orders by the weighted
+    6T score, with ?weights= listing the weights in 6T order, e.g. 2,1,1,1,1,1.
+    """
+    card_index.cards()
+
+    def render():
+        submission_index = get_submission_index()
+        query = submission_query()
+        weighted = None
+        if query['sort'] == 'weighted':
+            weights = parse_weights(request.args.get('weights'))
+            query['weights'] = weights
+            weighted = get_score_analytics().weighted_totals(weights)
+        result = submission_index.search(**{k: v for k, v in query.items() if k != 'weights'}, weighted=weighted)
+        cohorts = [{'number': c,
+                    'description': cohort_description(c, card_index.cohort_cutoffs),
+                    'size': submission_index.cohort_size(c),
+                    'count': result['cohort_counts'].get(c, 0)} for c in submission_index.cohorts or [1]]
+        return compact_json({
+            'status': 'success',
+            'query': query,
+            'total': result['total'],
+            'total_submissions': len(submission_index.cards),
+            'page': result['page'],
+            'pages': result['pages'],
+            'per_page': result['per_page'],
+            'cohorts': cohorts,
+            'status_counts': result['status_counts'],
+            'score_counts': result['score_counts'],
+            'fields': CARD_FIELDS,
+            'rows': compact_rows([{**card, **card_fields(market_matches.get(card.get('slug')))}
+                                  for card in result['results']]),
+        })
+
+    market_matches = get_market_matches()
+    return conditional_response(f"{card_index.etag}-{market_map.version}-api",
+                                newest(card_index.last_modified, market_map.last_modified), render)
+
+@app.route('/api/rank')
+@login_required
+def api_rank():
+    """
+    Rank every applicant by a weighted mean of their 6T scores, e.g.
+    ?team=2&traction=1.5 (unset weights count once, k= top results, default 20)
+
+    Each result carries its per-T score, weight and contribution.
+    """
+    card_index.cards()
+
+    def render():
+        analytics = get_score_analytics()
+        weights = normalize_weights({t: request.args.get(t, type=float) for t in SIX_TS})
+        top_k = min(max(request.args.get('k', TOP_K, type=int), 1), len(analytics.slugs) or 1)
+        return compact_json({
+            'status': 'success',
+            'weights': weights,
+            'total': len(analytics.slugs),
+            'results': analytics.ranking(weights, top_k),
+        })
+
+    return conditional_response(f"{card_index.etag}-rank", card_index.last_modified, render)
+
+@app.route('/api/similar/<company_name>')
+@login_required
+def api_similar(company_name):
+    """Applicants whose description, problem statement and competitors are closest to this one's"""
+    card_index.cards()
+    slug = card_slug(company_name)
+
+    def render():
+        matches = get_similarity_index().similar(slug, request.args.get('k', TOP_SIMILAR, type=int))
+        if matches is None:
+            return jsonify({'status': 'error', 'message': f'No applicant found for {company_name}'}), 404
+        return compact_json({
+            'status': 'success',
+            'slug': slug,
+            'results': [{'slug': match['card'].get('slug'),
+                         'company_name': match['card'].get('company_name'),
+                         'status': match['card'].get('status'),
+                         'cohort': match['card'].get('cohort'),
+                         'similarity': match['similarity'],
+                         'shared': match['shared']} for match in matches],
+        })
+
+    return conditional_response(f"{card_index.etag}-similar", card_index.last_modified, render)
+
+@app.route('/api/duplicates')
+@login_required
+def api_duplicates():
+    """
+    Near-duplicate analyses on disk (comprehensive and legacy) for cleanup:
+    pairs with matching text, website or founder
+    """
+    duplicate_index = get_duplicate_index()
+
+    def render():
+        pairs = []
+        for pair in duplicate_index.pairs():
+            metas = [duplicate_index.entries[key][1] for key in pair['keys']]
+            pairs.append({'files': pair['keys'],
+                          'companies': [meta.get('company_name', '') for meta in metas],
+                          'similarity': pair['similarity'],
+                          'reasons': pair['reasons']})
+        return compact_json({'status': 'success', 'total': len(pairs), 'pairs': pairs})
+
+    return conditional_response(f"{_duplicates['etag']}-duplicates", None, render)
+
+@app.route('/api/analytics/scores')
+@login_required
+def api_score_analytics():
+    """
+    Portfolio 6T score statistics: per-T mean, spread, percentiles, histogram
+    and cohort means. With ?slug= also that company's score, z-score,
+    percentile rank and rank per T.
+    """
+    card_index.cards()
+    slug = request.args.get('slug', '').strip()
+    if slug:
+        slug = card_slug(slug)
+
+    def render():
+        analytics = get_score_analytics()
+        payload = {'status': 'success', **analytics.summary()}
+        if slug:
+            standing = analytics.company(slug)
+            if standing is None:
+                return jsonify({'status': 'error', 'message': f'No scores for {slug}'}), 404
+            payload['company'] = {'slug': slug, 'sections': standing}
+        return compact_json(payload)
+
+    etag = f"{card_index.etag}-analytics"
+    if slug:
+        etag += '-' + hashlib.sha1(slug.encode('utf-8')).hexdigest()[:12]
+    return conditional_response(etag, card_index.last_modified, render)
+
 def normalize_company_name(name):
     """Convert company name to lowercase and remove spaces"""
     return name.lower().replace(' ', '')
 
+# Sections of the detail page that are fetched lazily, in display order
+DETAIL_SECTIONS = SIX_TS + ['final_recommendation']
+
+def card_slug(company_name):
+    """The card slug of the applicant a URL slug, alias or token resolves to"""
+    entry = catalog.resolve(company_name)
+    if entry is not None:
+        return company_slug(entry.field('company_name'))
+    return company_slug(company_name)
+
+def load_analysis(company_name):
+    """
+    Resolve a URL slug to its analysis
+
+    Returns:
+        (catalog entry or None, document or None, source name for error messages)
+    """
+    entry = catalog.resolve(company_name)
+    if entry is not None:
+        return entry, entry.data, entry.name
+
+    # Analyses imported from analysis/legacy/ only live in the store
+    if store.ensure():
+        return None, to_model(store.get(company_name)), STORE_PATH.name
+    return None, None, STORE_PATH.name
+
 @app.route('/submission/<company_name>')
 @login_required
 def submission_detail(company_name):
-    print(f"=== Submission Detail Request ===")
-    print(f"Requested company_name: '{company_name}'")
-    
-    # Normalize company name for file lookup
-    normalized_name = company_name.lower().replace(' ', '_').replace('-', '_')
-    
-    # Try different possible filename variations for comprehensive analyses
-    possible_filenames = [
-        f"{normalized_name}_comprehensive_analysis.json",
-        f"{company_name.lower()}_comprehensive_analysis.json",
-        f"{company_name.lower().replace(' ', '')}_comprehensive_analysis.json",
-        f"{company_name.lower().replace(' ', '_')}_comprehensive_analysis.json",
-        f"{company_name.lower().replace(' ', '-')}_comprehensive_analysis.json",
-        # Fallback to legacy analysis files if comprehensive not found
-        f"{normalized_name}_analysis.json",
-        f"{company_name.lower()}_analysis.json",
-        f"{company_name.lower().replace(' ', '')}_analysis.json",
-        f"{company_name.lower().replace(' ', '_')}_analysis.json",
-        f"{company_name.lower().replace(' ', '-')}_analysis.json"
-    ]
-    
-    # Comprehensive mapping of URL names to actual filenames
-    special_cases = {
-        # Companies with "AI" in the name - comprehensive analysis files
-        "sunnyhealthai": "sunny_health_ai_comprehensive_analysis.json",
-        "sunnyhealth": "sunny_health_ai_comprehensive_analysis.json",
-        "sunny": "sunny_health_ai_comprehensive_analysis.json",
-        "graphioai": "graphioai_comprehensive_analysis.json",
-        "graphio": "graphioai_comprehensive_analysis.json",
-        "graphio.ai": "graphioai_comprehensive_analysis.json",
-        "logistifyai": "logistify_ai_comprehensive_analysis.json",
-        "logistify": "logistify_ai_comprehensive_analysis.json",
-        "borderlessai": "borderless_ai_comprehensive_analysis.json",
-        "borderless": "borderless_ai_comprehensive_analysis.json",
-
-        # Companies with spaces or special characters - comprehensive analysis files
-        "voltahealth": "volta_health_comprehensive_analysis.json",
-        "volta": "volta_health_comprehensive_analysis.json",
-        "jogohealth": "jogo_health_comprehensive_analysis.json",
-        "jogo": "jogo_health_comprehensive_analysis.json",
-        "joyahealth": "joya_health_comprehensive_analysis.json",
-        "joya": "joya_health_comprehensive_analysis.json",
-        "defianthealth": "defiant_health_comprehensive_analysis.json",
-        "defiant": "defiant_health_comprehensive_analysis.json",
-        "blankslate": "blank_slate_technologies_comprehensive_analysis.json",
-        "blankslatetech": "blank_slate_technologies_comprehensive_analysis.json",
-        "blankslatetechnologies": "blank_slate_technologies_comprehensive_analysis.json",
-        "virtualsapiens": "virtual_sapiens_comprehensive_analysis.json",
-        "mandalaforus": "mandala_for_us_inc_comprehensive_analysis.json",
-        "mandalaforusinc": "mandala_for_us_inc_comprehensive_analysis.json",
-        "mandala": "mandala_for_us_inc_comprehensive_analysis.json",
-        "paramean": "paramean_solutions_comprehensive_analysis.json",
-        "parameansolutions": "paramean_solutions_comprehensive_analysis.json",
-        "doktorconnect": "doktorconnect_comprehensive_analysis.json",
-        "hero": "hero_comprehensive_analysis.json",
-        "clasp": "clasp_comprehensive_analysis.json",
-        "clsp": "clasp_comprehensive_analysis.json",
-        "cryptomate": "cryptomate_comprehensive_analysis.json",
-        "beacon": "beacon_comprehensive_analysis.json",
-        "aidora": "aidora_comprehensive_analysis.json",
-        "ezra": "ezra_comprehensive_analysis.json",
-        "gtmflow": "gtmflow_comprehensive_analysis.json",
-        "smartheritance": "smartheritance_comprehensive_analysis.json",
-        "guaranteedhealth": "guaranteed_health_inc_comprehensive_analysis.json",
-        "guaranteedhealth,inc": "guaranteed_health_inc_comprehensive_analysis.json",
-        "guaranteedhealthinc": "guaranteed_health_inc_comprehensive_analysis.json",
-        "guaranteed": "guaranteed_health_inc_comprehensive_analysis.json",
-        "keptinc": "kept_inc_comprehensive_analysis.json",
-        "kept": "kept_inc_comprehensive_analysis.json",
-        "wigglhealth": "wiggl_health_comprehensive_analysis.json",
-        "wiggl": "wiggl_health_comprehensive_analysis.json",
-        "lockwellinc": "lockwell_inc_comprehensive_analysis.json",
-        "lockwell": "lockwell_inc_comprehensive_analysis.json",
-        "gigeasy": "gigeasy_comprehensive_analysis.json",
-        "gighqai": "gighqai_comprehensive_analysis.json",
-        "gighq": "gighqai_comprehensive_analysis.json",
-        "icommute": "icommute_comprehensive_analysis.json",
-        "thepeoappinc": "the_peo_app_inc_comprehensive_analysis.json",
-        "thepeoapp": "the_peo_app_inc_comprehensive_analysis.json",
-        "peoapp": "the_peo_app_inc_comprehensive_analysis.json",
-        "cherrygiving": "cherrygiving_comprehensive_analysis.json",
-
-        # Complete mappings for all companies with space/underscore issues (generated by check_url_mappings.py)
-        "affinitytest": "affinity_test_comprehensive_analysis.json",
-        "agavehealth": "agave_health_comprehensive_analysis.json",
-        "aximaai": "axima_ai_comprehensive_analysis.json",
-        "blankslatetechnologies": "blank_slate_technologies_comprehensive_analysis.json",
-        "bogaisaptyltd": "bogaisa_pty_ltd_comprehensive_analysis.json",
-        "borderlessai": "borderless_ai_comprehensive_analysis.json",
-        "counterfin": "counter_fin_comprehensive_analysis.json",
-        "deepcare": "deep_care_comprehensive_analysis.json",
-        "defianthealth": "defiant_health_comprehensive_analysis.json",
-        "factoscapital": "factos_capital_comprehensive_analysis.json",
-        "fifthealth": "fift_health_comprehensive_analysis.json",
-        "firepithealth": "firepit_health_comprehensive_analysis.json",
-        "guaranteedhealthinc": "guaranteed_health_inc_comprehensive_analysis.json",
-        "herdhealth": "herd_health_comprehensive_analysis.json",
-        "jogohealth": "jogo_health_comprehensive_analysis.json",
-        "joyahealth": "joya_health_comprehensive_analysis.json",
-        "keptinc": "kept_inc_comprehensive_analysis.json",
-        "kottackaltechnologiesqfzllc": "kottackal_technologies_qfz_llc_comprehensive_analysis.json",
-        "logistifyai": "logistify_ai_comprehensive_analysis.json",
-        "lockwellinc": "lockwell_inc_comprehensive_analysis.json",
-        "magierai": "magier_ai_comprehensive_analysis.json",
-        "mandalaforusinc": "mandala_for_us_inc_comprehensive_analysis.json",
-        "mybenefitoptions": "my_benefit_options_comprehensive_analysis.json",
-        "nucocredentialing": "nuco_credentialing_comprehensive_analysis.json",
-        "outrohealth": "outro_health_comprehensive_analysis.json",
-        "parameansolutions": "paramean_solutions_comprehensive_analysis.json",
-        "sundllc": "sund_llc_comprehensive_analysis.json",
-        "sunnyhealthai": "sunny_health_ai_comprehensive_analysis.json",
-        "thepeoappinc": "the_peo_app_inc_comprehensive_analysis.json",
-        "valuebuddy": "value_buddy_comprehensive_analysis.json",
-        "virtualsapiens": "virtual_sapiens_comprehensive_analysis.json",
-        "voltahealth": "volta_health_comprehensive_analysis.json",
-        "waypavellc": "waypave_llc_comprehensive_analysis.json",
-        "wigglhealth": "wiggl_health_comprehensive_analysis.json"
-    }
-    
-    if company_name.lower() in special_cases:
-        possible_filenames.insert(0, special_cases[company_name.lower()])
-    
-    # Debug: Print all available analysis files
-    print("Available analysis files:")
-    for file in ANALYSIS_DIR.glob('*_comprehensive_analysis.json'):
-        print(f"  - {file.name}")
-    print("Legacy analysis files:")
-    for file in ANALYSIS_DIR.glob('*_analysis.json'):
-        print(f"  - {file.name}")
-    
-    for filename in possible_filenames:
-        analysis_file = ANALYSIS_DIR / filename
-        print(f"Looking for file: {analysis_file}")
-        
-        if analysis_file.exists():
-            print(f"Found file: {analysis_file}")
-            try:
-                with open(analysis_file, 'r', encoding='utf-8') as f:
-                    analysis = json.load(f)
-                
-                # Add debug output
-                print("Loaded analysis data:")
-                
-                # Ensure all required sections exist with proper structure
-                # Executive Summary
-                if 'executive_summary' not in analysis:
-                    analysis['executive_summary'] = {
-                        'company_name': analysis.get('company_name', ''),
-                        'website': analysis.get('website', ''),
-                        'year_founded': analysis.get('year_founded', ''),
-                        'description': analysis.get('description', '')
-                    }
-                
-                # Scoring
-                if 'scoring' not in analysis:
-                    analysis['scoring'] = {}
-                
-                for score_category in ['market_opportunity', 'product_differentiation', 
-                                      'go_to_market_traction', 'ecosystem_signals', 
-                                      'founder_team_strength', 'strategic_fit']:
-                    if score_category not in analysis['scoring']:
-                        analysis['scoring'][score_category] = {
-                            'score': None,
-                            'justification': f'No {score_category.replace("_", " ")} assessment available.'
-                        }
-                
-                # Founder Profile
-                if 'founder_profile' not in analysis:
-                    analysis['founder_profile'] = {
-                        'name': 'Not available',
-                        'highlights': [],
-                        'linkedin': ''
-                    }
-                
-                # SV Thesis Fit
-                if 'sv_thesis_fit' not in analysis:
-                    analysis['sv_thesis_fit'] = {}
-                
-                for fit_category in ['sector_fit', 'employer_ecosystem_leverage', 
-                                    'gtm_support_potential', 'strategic_partner_amplification', 
-                                    'acceleration_readiness']:
-                    if fit_category not in analysis['sv_thesis_fit']:
-                        analysis['sv_thesis_fit'][fit_category] = {
-                            'score': None,
-                            'justification': f'No {fit_category.replace("_", " ")} assessment available.'
-                        }
-                
-                # Red Flags
-                if 'red_flags' not in analysis:
-                    analysis['red_flags'] = []
-                
-                # Category Comparison
-                if 'category_comparison' not in analysis:
-                    analysis['category_comparison'] = ""
-                
-                # Category Comparison Expanded
-                if 'category_comparison_expanded' not in analysis:
-                    analysis['category_comparison_expanded'] = {
-                        'primary_competitors': [],
-                        'competitive_matrix': {
-                            'columns': [],
-                            'rows': {}
-                        },
-                        'conclusion': ""
-                    }
-                else:
-                    # Ensure all required fields exist in category_comparison_expanded
-                    if 'primary_competitors' not in analysis['category_comparison_expanded']:
-                        analysis['category_comparison_expanded']['primary_competitors'] = []
-                    
-                    if 'competitive_matrix' not in analysis['category_comparison_expanded']:
-                        analysis['category_comparison_expanded']['competitive_matrix'] = {
-                            'columns': [],
-                            'rows': {}
-                        }
-                    else:
-                        if 'columns' not in analysis['category_comparison_expanded']['competitive_matrix']:
-                            analysis['category_comparison_expanded']['competitive_matrix']['columns'] = []
-                        if 'rows' not in analysis['category_comparison_expanded']['competitive_matrix']:
-                            analysis['category_comparison_expanded']['competitive_matrix']['rows'] = {}
-                    
-                    if 'conclusion' not in analysis['category_comparison_expanded']:
-                        analysis['category_comparison_expanded']['conclusion'] = ""
-                
-                # Successes and Areas of Investigation
-                if 'successes_and_areas_of_investigation' not in analysis:
-                    analysis['successes_and_areas_of_investigation'] = []
-                
-                # Final Recommendation
-                if 'final_recommendation' not in analysis:
-                    analysis['final_recommendation'] = {
-                        'status': 'Pending',
-                        'rationale': 'Final recommendation is pending review.'
-                    }
-                elif isinstance(analysis['final_recommendation'], str):
-                    status = analysis['final_recommendation']
-                    analysis['final_recommendation'] = {
-                        'status': status,
-                        'rationale': 'See detailed analysis for rationale.'
-                    }
-                
-                print(f"SV Thesis Fit keys: {analysis.get('sv_thesis_fit', {}).keys()}")
-                return render_template('detail.html', analysis=analysis)
-                
-            except json.JSONDecodeError as e:
-                print(f"Error parsing JSON file {analysis_file}: {e}")
-                return render_template('error.html', 
-                                      company_name=company_name,
-                                      error_message=f"Invalid JSON format in analysis file: {e}",
-                                      tried_filenames=possible_filenames,
-                                      available_files=[f.name for f in ANALYSIS_DIR.glob('*_analysis.json')]), 500
-            except Exception as e:
-                print(f"Error processing analysis file {analysis_file}: {e}")
-                return render_template('error.html', 
-                                      company_name=company_name,
-                                      error_message=f"Error processing analysis file: {str(e)}",
-                                      tried_filenames=possible_filenames,
-                                      available_files=[f.name for f in ANALYSIS_DIR.glob('*_analysis.json')]), 500
-    
-    # If we get here, we couldn't find the file - let's provide more helpful error info
-    print(f"No analysis file found for company: {company_name}")
-    print(f"Tried the following filenames:")
-    for filename in possible_filenames:
-        print(f"  - {filename}")
-    
-    return render_template('error.html', 
-                          company_name=company_name, 
-                          tried_filenames=possible_filenames,
-                          available_files=[f.name for f in ANALYSIS_DIR.glob('*_analysis.json')]), 404
+    log.debug("Submission detail request", extra={'fields': {'slug': company_name}})
+
+    entry = catalog.resolve(company_name)
+    if entry is not None and entry.digest:
+        # Answer revalidations from the digest without decoding the analysis
+        log.debug("Found analysis %s", entry.name)
+        version = template_version()
+        market_version = market_map.refresh()
+        return conditional_response(
+            f"{entry.digest}-{market_version}-{version}",
+            newest(entry.last_modified, template_last_modified(), market_map.last_modified),
+            lambda: render_cache.get_or_render(
+                entry.name, ('detail.html', entry.digest, version, market_version, company_name),
+                lambda: render_template('detail.html', analysis=entry.data, slug=company_name,
+                                        card_slug=company_slug(entry.field('company_name')),
+                                        market=market_map.match(entry.data.get('company_name'), entry.data.get('website')))
+            )
+        )
+
+    _, document, source_name = load_analysis(company_name)
+
+    if document is None:
+        log.info("No analysis file found for company: %s", company_name)
+        return render_template('error.html',
+                              company_name=company_name,
+                              tried_filenames=[company_slug(company_name)],
+                              available_files=catalog.filenames()), 404
+
+    log.debug("Found analysis %s", source_name)
+    return render_template('detail.html', analysis=document, slug=company_name,
+                           card_slug=company_slug(document.get('company_name') or company_name),
+                           market=market_map.match(document.get('company_name'), document.get('website')))
+
+@app.route('/api/submission/<company_name>/<section>')
+@login_required
+def submission_section(company_name, section):
+    """Return one section of an analysis as JSON, or as rendered HTML with ?format=html"""
+    if section not in DETAIL_SECTIONS:
+        return jsonify({
+            'status': 'error',
+            'message': f'Unknown section: {section}'
+        }), 404
+
+    as_html = request.args.get('format') == 'html'
+
+    entry = catalog.resolve(company_name)
+    if entry is not None and entry.digest:
+        last_modified = entry.last_modified
+        if as_html:
+            version = template_version()
+            etag = f"{entry.digest}-{section}-html-{version}"
+            last_modified = newest(last_modified, template_last_modified())
+            build = lambda: render_cache.get_or_render(
+                entry.name, (section, entry.digest, version),
+                lambda: render_template(f'sections/{section}.html', analysis={section: entry.data[section]})
+            )
+        else:
+            etag = f"{entry.digest}-{section}-json"
+            build = lambda: app.response_class(entry.shard(section), mimetype='application/json')
+        return conditional_response(etag, last_modified, build)
+
+    _, document, _ = load_analysis(company_name)
+    if document is None:
+        return jsonify({
+            'status': 'error',
+            'message': f'No analysis found for {company_name}'
+        }), 404
+
+    if as_html:
+        return render_template(f'sections/{section}.html', analysis={section: document[section]})
+    return jsonify(document[section].to_dict())
 
 def get_google_sheet_as_csv(sheet_url: str) -> str:
     """Convert Google Sheets URL to CSV export URL and fetch data"""
@@ -981,15 +1223,10 @@ def get_existing_companies() -> set:
     """Get set of companies that already have analysis files"""
     existing = set()
 
-    for analysis_file in ANALYSIS_DIR.glob('*_analysis.json'):
-        try:
-            with open(analysis_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                company_name = data.get('company_name', '')
-                if company_name:
-                    existing.add(re.sub(r'[^a-z0-9]', '', company_name.lower()))
-        except Exception:
-            continue
+    for data in catalog.analyses():
+        company_name = data.get('company_name', '')
+        if company_name:
+            existing.add(re.sub(r'[^a-z0-9]', '', company_name.lower()))
 
     return existing
 
@@ -1192,7 +1429,7 @@ Generate the complete JSON analysis now:
         return analysis
 
     except Exception as e:
-        print(f"Error generating comprehensive analysis for {company_name}: {e}")
+        log.error("Error generating comprehensive analysis for %s: %s", company_name, e)
         raise
 
 @app.route('/sync_spreadsheet')
@@ -1205,7 +1442,7 @@ def sync_spreadsheet():
 
         # If no URL provided, return current status
         if not sheet_url:
-            current_analyses = len(list(ANALYSIS_DIR.glob('*_comprehensive_analysis.json')))
+            current_analyses = len(catalog.filenames('_comprehensive_analysis.json'))
             return jsonify({
                 'status': 'info',
                 'message': 'Dashboard up to date' if current_analyses >= 67 else 'Google Spreadsheet sync ready. Please provide the spreadsheet URL.',
@@ -1227,10 +1464,12 @@ def sync_spreadsheet():
             token_db = {'analyzed_tokens': {}, 'last_sync': None, 'total_submissions': 0, 'analyzed_count': 0}
 
         analyzed_tokens = set(token_db.get('analyzed_tokens', {}).keys())
+        if store.ensure():
+            analyzed_tokens |= store.tokens()
 
         # Find new companies using token-based tracking
         new_companies = []
-        print(f"🔍 Checking {len(submissions)} submissions against {len(analyzed_tokens)} analyzed tokens")
+        log.info("Checking %d submissions against %d analyzed tokens", len(submissions), len(analyzed_tokens))
 
         for submission in submissions:
             token = submission.get('Token', '').strip()
@@ -1238,51 +1477,56 @@ def sync_spreadsheet():
 
             if token and token not in analyzed_tokens:
                 new_companies.append(submission)
-                print(f"🆕 Found new company: {company_name} (Token: {token})")
+                log.debug("Found new company", extra={'fields': {'company': company_name, 'token': token}})
 
-        print(f"📊 Total new companies found: {len(new_companies)}")
+        log.info("Total new companies found: %d", len(new_companies))
+
+        # Resubmissions of a company already analysed (same text or website)
+        # would cost a full generation each; ?allow_duplicates=1 overrides
+        duplicates = []
+        if new_companies and not request.args.get('allow_duplicates'):
+            new_companies, duplicates = screen_submissions(get_duplicate_index(), new_companies)
+            for duplicate in duplicates:
+                log.info("Skipping near-duplicate submission", extra={'fields': duplicate})
+        skipped_note = f" Skipped {len(duplicates)} near-duplicate submission(s)." if duplicates else ''
 
         # Check if there are any new companies
         if len(new_companies) == 0:
             return jsonify({
                 'status': 'success',
-                'message': 'Dashboard up to date',
+                'message': 'Dashboard up to date.' + skipped_note if duplicates else 'Dashboard up to date',
                 'total_in_sheet': len(submissions),
                 'existing_analyses': len(analyzed_tokens),
                 'new_companies_found': 0,
-                'analyses_generated': 0
+                'analyses_generated': 0,
+                'duplicates_skipped': duplicates
             })
 
         # Generate analyses for new companies (limit to avoid timeouts)
         generated_count = 0
         batch_size = min(5, len(new_companies))  # Process max 5 at a time
-        print(f"🔄 Starting analysis generation for {batch_size} companies")
+        log.info("Starting analysis generation for %d companies", batch_size)
 
         for submission in new_companies[:batch_size]:
             try:
                 company_name = submission.get('Company Name', '')
                 token = submission.get('Token', '')
-                print(f"🔄 Generating analysis for: {company_name} (Token: {token})")
+                log.info("Generating analysis", extra={'fields': {'company': company_name, 'token': token}})
 
                 # Generate comprehensive analysis instead of legacy analysis
                 analysis = generate_comprehensive_analysis(submission)
-                print(f"✅ Analysis generated for: {company_name}")
 
                 # Save comprehensive analysis
                 safe_filename = re.sub(r'[^a-z0-9]', '', company_name.lower())
                 analysis_file = ANALYSIS_DIR / f"{safe_filename}_comprehensive_analysis.json"
 
-                with open(analysis_file, 'w', encoding='utf-8') as f:
-                    json.dump(analysis, f, indent=2)
-                print(f"💾 Analysis saved to: {analysis_file}")
-
+                save_analysis(analysis_file, analysis)
                 generated_count += 1
-                print(f"📈 Generated count: {generated_count}")
+                log.info("Analysis saved", extra={'fields': {'company': company_name, 'file': analysis_file.name,
+                                                             'generated': generated_count}})
 
             except Exception as e:
-                print(f"❌ Error generating analysis for {company_name}: {e}")
-                import traceback
-                traceback.print_exc()
+                log.exception("Error generating analysis for %s: %s", company_name, e)
                 continue
 
         # Update token database with new analyses
@@ -1312,21 +1556,22 @@ def sync_spreadsheet():
 
             # Move temporary file to final location
             shutil.move(temp_path, token_db_path)
-            print(f"✅ Token database updated successfully")
+            log.info("Token database updated")
 
         except Exception as e:
-            print(f"⚠️ Warning: Could not update token database: {e}")
+            log.warning("Could not update token database: %s", e)
             # Continue without failing the entire sync
 
         return jsonify({
             'status': 'success',
-            'message': f'Synced with spreadsheet. Generated {generated_count} new analyses.' if generated_count > 0 else 'Dashboard up to date',
+            'message': (f'Synced with spreadsheet. Generated {generated_count} new analyses.' if generated_count > 0 else 'Dashboard up to date') + skipped_note,
             'total_in_sheet': len(submissions),
             'existing_analyses': len(analyzed_tokens) + generated_count,
             'new_companies_found': len(new_companies),
             'analyses_generated': generated_count,
             'remaining_to_process': max(0, len(new_companies) - batch_size),
-            'companies_processed': [submission.get('Company Name', '') for submission in new_companies[:generated_count]]
+            'companies_processed': [submission.get('Company Name', '') for submission in new_companies[:generated_count]],
+            'duplicates_skipped': duplicates
         })
 
     except Exception as e:
@@ -1341,21 +1586,16 @@ def sync_status():
     """Check current sync status and provide instructions"""
     try:
         existing_companies = get_existing_companies()
-        analysis_files = list(ANALYSIS_DIR.glob('*_analysis.json'))
+        analyses = catalog.analyses()
 
         # Get some sample company names
-        sample_companies = []
-        for analysis_file in analysis_files[:5]:
-            try:
-                with open(analysis_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    sample_companies.append(data.get('company_name', 'Unknown'))
-            except Exception:
-                continue
+        sample_companies = [
+            data.get('company_name', 'Unknown') for data in analyses[:5]
+        ]
 
         return jsonify({
             'status': 'success',
-            'current_analyses': len(analysis_files),
+            'current_analyses': len(analyses),
             'sample_companies': sample_companies,
             'instructions': {
                 'step1': 'Get the Google Spreadsheet URL (must be publicly viewable)',
@@ -1370,6 +1610,87 @@ def sync_status():
             'message': str(e)
         }), 500
 
+# Field scopes offered by the search page: each of the 6Ts, its red flags and the recommendation
+SEARCH_SCOPES = []
+for t in SIX_TS:
+    label = 'TAM' if t == 'tam' else t.title()
+    SEARCH_SCOPES += [(t, label), (f"{t}.red_flags", f"{label} red flags")]
+SEARCH_SCOPES.append(('final_recommendation', 'Final recommendation'))
+
+@app.route('/search')
+@login_required
+def search():
+    """Full-text search page across every analysis field"""
+    q = request.args.get('q', '').strip()
+    field = request.args.get('field', '').strip() or None
+    available = store.ensure()
+    results = store.search(q, field) if q and available else []
+    return render_template('search.html', q=q, field=field, fields=SEARCH_SCOPES,
+                           results=results, store_available=available)
+
+@app.route('/api/search')
+@login_required
+def api_search():
+    """Full-text search as JSON: ?q=payroll compliance&field=traction.red_flags"""
+    if not store.ensure():
+        return jsonify({
+            'status': 'error',
+            'message': 'Analysis store could not be created; see the server log.'
+        }), 503
+    q = request.args.get('q', '').strip()
+    field = request.args.get('field', '').strip() or None
+    return jsonify({'status': 'success', 'q': q, 'field': field, 'results': store.search(q, field)})
+
+@app.route('/compare')
+@login_required
+def compare():
+    """Side-by-side 6T comparison of up to MAX_COMPANIES analyses: /compare?slugs=beacon,ezra"""
+    analyses, missing, digests, seen = [], [], [], set()
+    for slug in [s.strip() for s in request.args.get('slugs', '').split(',') if s.strip()]:
+        entry, document, source_name = load_analysis(slug)
+        if document is None:
+            missing.append(slug)
+            continue
+        key = entry.name if entry is not None else company_slug(document.get('company_name') or slug)
+        if key in seen:
+            continue
+        seen.add(key)
+        analyses.append((slug, document))
+        digests.append(entry.digest if entry is not None else None)
+    truncated = len(analyses) > MAX_COMPANIES
+    analyses, digests = analyses[:MAX_COMPANIES], digests[:MAX_COMPANIES]
+
+    def render():
+        return render_template('compare.html', comparison=build_comparison(analyses),
+                               slugs=','.join(slug for slug, _ in analyses), missing=missing,
+                               truncated=truncated, max_companies=MAX_COMPANIES)
+
+    if analyses and all(digests):
+        # Documents come from the catalog, so their digests identify the page
+        key = '|'.join(digests + missing + [str(truncated)])
+        etag = f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}-{template_version()}"
+        return conditional_response(etag, None, render)
+    return render()
+
+@app.route('/export/analyses.csv')
+@login_required
+def export_analyses():
+    """Export 6T scores and recommendations for every analysis from the SQLite store"""
+    if not store.ensure():
+        return jsonify({
+            'status': 'error',
+            'message': 'Analysis store could not be created; see the server log.'
+        }), 503
+
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    writer.writerows(store.export_rows())
+    return output.getvalue(), 200, {
+        'Content-Type': 'text/csv; charset=utf-8',
+        'Content-Disposition': 'attachment; filename=sempervirens_analyses_export.csv'
+    }
+
 @app.route('/generate_analysis')
 @login_required
 def generate_analysis():
@@ -1401,8 +1722,7 @@ def generate_single_analysis(company_name):
                     
                     # Save analysis
                     analysis_file = ANALYSIS_DIR / f"{company_name.lower()}_analysis.json"
-                    with open(analysis_file, 'w', encoding='utf-8') as f:
-                        json.dump(analysis, f, indent=2)
+                    save_analysis(analysis_file, analysis)
                     
                     return jsonify({
                         'status': 'success',
@@ -1424,7 +1744,7 @@ def generate_single_analysis(company_name):
 def start_server(host='127.0.0.1', port=5000, debug=False):
     """Start the Flask web server"""
     setup_directories()
-    print(f"Starting web server on {host}:{port}")
+    log.info("Starting web server on %s:%s", host, port)
     app.run(host=host, port=port, debug=debug)
 
 def main():
@@ -1445,27 +1765,27 @@ def main():
 @app.errorhandler(500)
 def internal_server_error(e):
     """Handle internal server errors"""
-    print(f"Internal Server Error: {str(e)}")
+    log.error("Internal Server Error: %s", e)
     return render_template('error.html', 
                           company_name="Unknown", 
                           error_message="An internal server error occurred. Please try again later.",
                           tried_filenames=[],
-                          available_files=[f.name for f in ANALYSIS_DIR.glob('*_analysis.json')]), 500
+                          available_files=catalog.filenames()), 500
 
 @app.errorhandler(404)
 def page_not_found(e):
     """Handle 404 errors"""
-    print(f"Page Not Found: {str(e)}")
+    log.info("Page Not Found: %s", e)
     return render_template('error.html', 
                           company_name="Unknown", 
                           error_message="The requested page was not found.",
                           tried_filenames=[],
-                          available_files=[f.name for f in ANALYSIS_DIR.glob('*_analysis.json')]), 404
+                          available_files=catalog.filenames()), 404
 
 # For Vercel deployment
 app_instance = app
 
-print("sva.py module loaded successfully")
+log.debug("sva.py module loaded")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Logging Setup for SemperVirens Accelerator
+Structured logging for the web app and sync scripts. Messages use %-style
+arguments so nothing is formatted unless the record is actually emitted;
+extra fields go in extra={'fields': {...}}. Entry points call
+configure_logging() once, after loading .env.
+
+Environment:
+    SVA_LOG_LEVEL    DEBUG, INFO (default), WARNING or ERROR; anything else
+                     falls back to INFO with a warning
+    SVA_LOG_FORMAT   "text" (default) or "json" for one object per line
+    SVA_LOG_SAMPLE   fraction of sub-WARNING records to keep per Flask endpoint,
+                     e.g. "index=0.01,submission_detail=0.1"
+"""
+
+import json
+import logging
+import os
+import random
+import sys
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+ROOT_LOGGER = 'sva'
+
+_configured = False
+
+
+def _endpoint() -> Optional[str]:
+    """Endpoint of the current Flask request, if any; Flask is not required"""
+    flask = sys.modules.get('flask')
+    if flask is not None and flask.has_request_context():
+        return flask.request.endpoint
+    return None
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """Parse "index=0.01,submission_detail=0.1" into {endpoint: rate}"""
+    rates = {}
+    for item in (value or '').split(','):
+        endpoint, _, rate = item.partition('=')
+        try:
+            rates[endpoint.strip()] = min(max(float(rate), 0.0), 1.0)
+        except ValueError:
+            continue
+    return rates
+
+
+class RouteSampler(logging.Filter):
+    """Keep a fraction of DEBUG/INFO records per endpoint; warnings and errors always pass"""
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        rate = self.rates.get(_endpoint())
+        return rate is None or random.random() < rate
+
+
+class StructuredFormatter(logging.Formatter):
+    """`time level logger: message key=value ...` lines, or JSON objects"""
+
+    def __init__(self, as_json: bool = False):
+        super().__init__()
+        self.as_json = as_json
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = dict(getattr(record, 'fields', None) or {})
+        endpoint = _endpoint()
+        if endpoint:
+            fields.setdefault('route', endpoint)
+        timestamp = datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec='milliseconds')
+
+        if self.as_json:
+            payload = {'ts': timestamp, 'level': record.levelname, 'logger': record.name,
+                       'msg': record.getMessage(), **fields}
+            if record.exc_info:
+                payload['exc'] = self.formatException(record.exc_info)
+            return json.dumps(payload, ensure_ascii=False, default=str)
+
+        line = f"{timestamp} {record.levelname:<7} {record.name}: {record.getMessage()}"
+        if fields:
+            line += ' ' + ' '.join(f"{k}={v!r}" if isinstance(v, str) and ' ' in v else f"{k}={v}"
+                                   for k, v in fields.items())
+        if record.exc_info:
+            line += '\n' + self.formatException(record.exc_info)
+        return line
+
+
+def configure_logging(level: Optional[str] = None):
+    """Attach the structured handler to the 'sva' logger (once per process)"""
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(StructuredFormatter(as_json=os.getenv('SVA_LOG_FORMAT', 'text').lower() == 'json'))
+    handler.addFilter(RouteSampler(parse_sample_rates(os.getenv('SVA_LOG_SAMPLE', ''))))
+
+    logger = logging.getLogger(ROOT_LOGGER)
+    level = (level or os.getenv('SVA_LOG_LEVEL') or 'INFO').strip().upper()
+    invalid = not isinstance(logging.getLevelName(level), int)
+    logger.setLevel(logging.INFO if invalid else level)
+    logger.addHandler(handler)
+    logger.propagate = False
+    if invalid:
+        logger.warning("Unknown log level %r, using INFO", level)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger under the 'sva' namespace"""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
@@ -0,0 +1,15 @@
+/** Tailwind config for `python build_css.py`; keep in step with templates/_stylesheets.html */
+module.exports = {
+  content: [
+    './templates/**/*.html',
+  ],
+  theme: {
+    extend: {
+      colors: {
+        'sv-blue': '#0A2540',
+        'sv-green': '#00B67A',
+        'sv-green-dark': '#00A067',
+      },
+    },
+  },
+};